@@ -1,7 +1,7 @@
-#!/usr/bin/env python2
+#!/usr/bin/env python3
 # -*- coding: UTF-8 -*-
 #
-import ConfigParser
+import configparser as ConfigParser
 import locale
 import os
 import platform
@@ -143,7 +143,7 @@ def main():
     if not os.access(lazylibrarian.DATADIR, os.W_OK):
         raise SystemExit('Cannot write to the data directory: ' + lazylibrarian.DATADIR + '. Exit ...')
 
-    print "Lazylibrarian is starting up..."
+    print("Lazylibrarian is starting up...")
     time.sleep(4)  # allow a bit of time for old task to exit if restarting. Needs to free logfile and server port.
 
     # create database and config
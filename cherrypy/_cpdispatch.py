@@ -206,9 +206,11 @@ try:
 except ImportError:
     test_callable_spec = lambda callable, args, kwargs: None
 else:
-    getargspec = inspect.getargspec
-    # Python 3 requires using getfullargspec if keyword-only arguments are present
-    if hasattr(inspect, 'getfullargspec'):
+    # Python 3 requires using getfullargspec if keyword-only arguments are
+    # present; inspect.getargspec was removed entirely in python 3.11
+    if not hasattr(inspect, 'getfullargspec'):
+        getargspec = inspect.getargspec
+    else:
         def getargspec(callable):
             return inspect.getfullargspec(callable)[:4]
 
@@ -115,7 +115,15 @@ Note that you have to explicitly set
 and not simply return an error message as a result.
 """
 
-from cgi import escape as _escape
+try:
+    from cgi import escape as _escape
+except ImportError:
+    # cgi.escape was removed in python 3.8; html.escape with quote off
+    # matches its behaviour
+    from html import escape as _html_escape
+
+    def _escape(s):
+        return _html_escape(s, quote=False)
 from sys import exc_info as _exc_info
 from traceback import format_exception as _format_exception
 from cherrypy._cpcompat import basestring, bytestr, iteritems, ntob
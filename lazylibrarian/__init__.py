@@ -16,7 +16,7 @@
 from __future__ import print_function
 from __future__ import with_statement
 
-import ConfigParser
+import configparser as ConfigParser
 import calendar
 import json
 import locale
@@ -34,7 +34,8 @@ from lazylibrarian import logger, postprocess, searchbook, searchrss, librarysyn
     searchmag, magazinescan, bookwork, importer, grsync
 from lazylibrarian.cache import fetchURL
 from lazylibrarian.common import restartJobs, logHeader
-from lazylibrarian.formatter import getList, bookSeries, plural, unaccented, check_int, unaccented_str, makeUnicode
+from lazylibrarian.formatter import getList, bookSeries, plural, unaccented, check_int, unaccented_str, \
+    makeUnicode, is_valid_booktype
 from lib.apscheduler.scheduler import Scheduler
 from lib.six import PY2, text_type
 
@@ -834,6 +835,9 @@ def config_read(reloaded=False):
         else:
             CONFIG[item] = 0
 
+    # cached verdicts may be stale if the type lists changed
+    is_valid_booktype.cache_clear()
+
     if reloaded:
         logger.info('Config file reloaded')
     else:
@@ -847,6 +851,8 @@ def config_write():
 
     threading.currentThread().name = "CONFIG_WRITE"
     myDB = database.DBConnection()
+    # the web interface may have changed the type lists
+    is_valid_booktype.cache_clear()
 
     interface = CFG.get('General', 'http_look')
 
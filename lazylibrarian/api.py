@@ -13,8 +13,8 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
-import ConfigParser
-import Queue
+import configparser as ConfigParser
+import queue as Queue
 import json
 import os
 import sys
@@ -12,6 +12,8 @@
 decode() and encode() are the major functions available, to decode
 and encode data. """
 
+from functools import reduce
+
 
 def collapse(data):
     """ Given an homogenous list, returns the items of that list
@@ -161,7 +163,7 @@ class BencodeError(Exception):
 def encode_int(data):
     """ Given an integer, returns a bencoded string of that integer. """
 
-    check_type(data, [int, long])
+    check_type(data, [int])
 
     return "i" + str(data) + "e"
 
@@ -190,7 +192,7 @@ def decode_int(data):
 def encode_str(data):
     """ Given a string, returns a bencoded string of that string. """
 
-    check_type(data, [str, basestring, unicode])
+    check_type(data, [str])
 
     # Return the length of the string, the colon, and the string itself.
     return str(len(data)) + ":" + data
@@ -285,10 +287,7 @@ def decode_dict(data):
 
 # Dictionaries of the data type, and the function to use
 encode_functions = {int: encode_int,
-                    long: encode_int,
                     str: encode_str,
-                    basestring: encode_str,
-                    unicode: encode_str,
                     list: encode_list,
                     set: encode_list,
                     tuple: encode_list,
@@ -16,7 +16,7 @@
 import os
 import shutil
 import time
-import urllib
+import urllib.parse
 import traceback
 import lib.id3reader as id3reader
 from lib.six import PY2
@@ -217,11 +217,22 @@ def seriesInfo(bookid, part=None):
     """ Return series info for a bookid as a formatted string (seriesname #number)
         or (seriesname number) if no numeric part, or if not numeric eg "Book Two"
         If part is "Name" or "Num" just return relevant part of result """
+    series, name, num = seriesInfo_all(bookid)
+    if part == 'Name' and name:
+        return name
+    if part == 'Num' and num:
+        return num
+    return series
+
+
+def seriesInfo_all(bookid):
+    """ Return (series, name, num) formatted strings for a bookid with one
+        set of lookups, for callers that want more than one part """
     myDB = database.DBConnection()
     cmd = 'SELECT SeriesID,SeriesNum from member WHERE bookid=?'
     res = myDB.match(cmd, (bookid,))
     if not res:
-        return ''
+        return '', '', ''
 
     seriesid = res['SeriesID']
     serieslist = getList(res['SeriesNum'])
@@ -250,15 +261,17 @@ def seriesInfo(bookid, part=None):
             if serieslist:
                 seriesname = "%s %s" % (seriesname, serieslist)
 
-    if part == 'Name' and seriesname:
-        return lazylibrarian.CONFIG['FMT_SERNAME'].replace('$SerName', seriesname).replace('$$', ' ')
-    elif part == 'Num' and seriesnum:
-        return lazylibrarian.CONFIG['FMT_SERNUM'].replace('$SerNum', seriesnum).replace('$$', ' ')
-    elif seriesname or seriesnum:
-        return lazylibrarian.CONFIG['FMT_SERIES'].replace('$SerNum', seriesnum).replace(
+    series = ''
+    name = ''
+    num = ''
+    if seriesname:
+        name = lazylibrarian.CONFIG['FMT_SERNAME'].replace('$SerName', seriesname).replace('$$', ' ')
+    if seriesnum:
+        num = lazylibrarian.CONFIG['FMT_SERNUM'].replace('$SerNum', seriesnum).replace('$$', ' ')
+    if seriesname or seriesnum:
+        series = lazylibrarian.CONFIG['FMT_SERIES'].replace('$SerNum', seriesnum).replace(
             '$SerName', seriesname).replace('$$', ' ')
-    else:
-        return ''
+    return series, name, num
 
 
 def bookRename(bookid):
@@ -707,12 +720,12 @@ def getBookWork(bookID=None, reason=None, seriesID=None):
                     title = title.encode(lazylibrarian.SYS_ENCODING)
                     author = author.encode(lazylibrarian.SYS_ENCODING)
                 URL = 'http://www.librarything.com/api/whatwork.php?author=%s&title=%s' % \
-                      (urllib.quote_plus(author), urllib.quote_plus(title))
+                      (urllib.parse.quote_plus(author), urllib.parse.quote_plus(title))
             else:
                 seriesname = safe_unicode(item['seriesName'])
                 if PY2:
                     seriesname = seriesname.encode(lazylibrarian.SYS_ENCODING)
-                URL = 'http://www.librarything.com/series/%s' % urllib.quote_plus(seriesname)
+                URL = 'http://www.librarything.com/series/%s' % urllib.parse.quote_plus(seriesname)
 
             librarything_wait()
             result, success = fetchURL(URL)
@@ -869,8 +882,8 @@ def getSeriesAuthors(seriesid):
             searchname = cleanName(unaccented(searchname))
             if PY2:
                 searchname = searchname.encode(lazylibrarian.SYS_ENCODING)
-            searchterm = urllib.quote_plus(searchname)
-            set_url = base_url + searchterm + '&' + urllib.urlencode(params)
+            searchterm = urllib.parse.quote_plus(searchname)
+            set_url = base_url + searchterm + '&' + urllib.parse.urlencode(params)
             authorid = ''
             try:
                 rootxml, in_cache = get_xml_request(set_url)
@@ -899,8 +912,8 @@ def getSeriesAuthors(seriesid):
                     searchname = cleanName(unaccented(bookname))
                     if PY2:
                         searchname = searchname.encode(lazylibrarian.SYS_ENCODING)
-                    searchterm = urllib.quote_plus(searchname)
-                    set_url = base_url + searchterm + '&' + urllib.urlencode(params)
+                    searchterm = urllib.parse.quote_plus(searchname)
+                    set_url = base_url + searchterm + '&' + urllib.parse.urlencode(params)
                     rootxml, in_cache = get_xml_request(set_url)
                     if rootxml is None:
                         logger.warn('Error getting XML for %s' % searchname)
@@ -1103,7 +1116,7 @@ def getBookCover(bookID=None, src=None):
                 title = title.encode(lazylibrarian.SYS_ENCODING)
                 author = author.encode(lazylibrarian.SYS_ENCODING)
             booklink = item['BookLink']
-            safeparams = urllib.quote_plus("%s %s" % (author, title))
+            safeparams = urllib.parse.quote_plus("%s %s" % (author, title))
 
         # try to get a cover from goodreads
         if not src or src == 'goodreads':
@@ -1210,7 +1223,7 @@ def getAuthorImage(authorid=None):
         authorname = safe_unicode(authors[0][0])
         if PY2:
             authorname = authorname.encode(lazylibrarian.SYS_ENCODING)
-        safeparams = urllib.quote_plus("author %s" % authorname)
+        safeparams = urllib.parse.quote_plus("author %s" % authorname)
         URL = "https://www.google.com/search?tbm=isch&tbs=ift:jpg&as_q=" + safeparams
         result, success = fetchURL(URL)
         if success:
@@ -23,12 +23,106 @@ import lazylibrarian
 from lazylibrarian import logger
 
 db_lock = threading.Lock()
+db_locals = threading.local()
+
+
+class Transaction:
+    """ Batch this thread's actions into one commit. Every statement run
+        while the block is open joins the transaction instead of paying
+        for its own disk sync; commits on exit, rolls back on exception """
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        # a transaction inside a transaction just joins the outer one
+        self.nested = getattr(db_locals, 'deferred', False)
+        if not self.nested:
+            # same locked-database retry as action(), another writer may
+            # hold the lock when we try to BEGIN
+            attempt = 0
+            while True:
+                try:
+                    with db_lock:
+                        self.connection.execute("BEGIN IMMEDIATE")
+                    break
+                except sqlite3.OperationalError as e:
+                    if "unable to open database file" in str(e) or "database is locked" in str(e):
+                        logger.warn('Database Error: %s' % e)
+                        attempt += 1
+                        if attempt == 5:
+                            logger.error("Failed to start transaction")
+                            raise
+                        time.sleep(1)
+                    else:
+                        raise
+            db_locals.deferred = True
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if self.nested:
+            return False
+        db_locals.deferred = False
+        with db_lock:
+            if exc_type:
+                self.connection.rollback()
+            else:
+                self.connection.commit()
+        return False
+
+
+class Batch:
+    """ Collect upserts and flush them together in one transaction.
+        Rows sharing a table and column signature go through a single
+        executemany UPDATE; rows that turn out not to exist yet fall back
+        to the ordinary per-row upsert to be inserted """
+    def __init__(self, db):
+        self.db = db
+        self.groups = {}
+
+    def upsert(self, tableName, valueDict, keyDict):
+        sig = (tableName, tuple(valueDict.keys()), tuple(keyDict.keys()))
+        self.groups.setdefault(sig, []).append((valueDict, keyDict))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if not exc_type:
+            self.flush()
+        return False
+
+    def flush(self):
+        with self.db.transaction():
+            for (tableName, vcols, kcols), rows in self.groups.items():
+                query = "UPDATE " + tableName + " SET " + ", ".join(x + " = ?" for x in vcols) + \
+                        " WHERE " + " AND ".join(x + " = ?" for x in kcols)
+                params = [list(v.values()) + list(k.values()) for v, k in rows]
+                with db_lock:
+                    changesBefore = self.db.connection.total_changes
+                    self.db.connection.executemany(query, params)
+                    updated = self.db.connection.total_changes - changesBefore
+                if updated < len(rows):
+                    # at least one row is new, let upsert sort out which
+                    for valueDict, keyDict in rows:
+                        self.db.upsert(tableName, valueDict, keyDict)
+        self.groups = {}
 
 
 class DBConnection:
     def __init__(self):
-        self.connection = sqlite3.connect(lazylibrarian.DBFILE, 20)
-        self.connection.row_factory = sqlite3.Row
+        # cache the sqlite connection per-thread, callers create
+        # DBConnection freely and each connect costs an open + pragma
+        connection = getattr(db_locals, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(lazylibrarian.DBFILE, 20)
+            connection.row_factory = sqlite3.Row
+            db_locals.connection = connection
+        self.connection = connection
+
+    def transaction(self):
+        return Transaction(self.connection)
+
+    def batch(self):
+        return Batch(self)
 
     def action(self, query, args=None, suppress=None):
         with db_lock:
@@ -46,7 +140,8 @@ class DBConnection:
                         sqlResult = self.connection.execute(query)
                     else:
                         sqlResult = self.connection.execute(query, args)
-                    self.connection.commit()
+                    if not getattr(db_locals, 'deferred', False):
+                        self.connection.commit()
                     break
 
                 except sqlite3.OperationalError as e:
@@ -73,7 +168,8 @@ class DBConnection:
                         if int(lazylibrarian.LOGLEVEL) > 2:
                             logger.debug('Suppressed [%s] %s' % (query, e))
                             logger.debug("Suppressed args: [%s]" % str(args))
-                        self.connection.commit()
+                        if not getattr(db_locals, 'deferred', False):
+                            self.connection.commit()
                         break
                     else:
                         logger.error('Database Integrity error: %s' % e)
@@ -121,7 +217,7 @@ class DBConnection:
         query = "UPDATE " + tableName + " SET " + ", ".join(self.genParams(valueDict)) + \
                 " WHERE " + " AND ".join(self.genParams(keyDict))
 
-        self.action(query, valueDict.values() + keyDict.values())
+        self.action(query, list(valueDict.values()) + list(keyDict.values()))
 
         # This version of upsert is not thread safe, each action() is thread safe,
         # but it's possible for another thread to jump in between the
@@ -129,6 +225,6 @@ class DBConnection:
 
         if self.connection.total_changes == changesBefore:
             query = "INSERT INTO " + tableName + " ("
-            query += ", ".join(valueDict.keys() + keyDict.keys()) + ") VALUES ("
-            query += ", ".join(["?"] * len(valueDict.keys() + keyDict.keys())) + ")"
-            self.action(query, valueDict.values() + keyDict.values(), suppress="UNIQUE")
+            query += ", ".join(list(valueDict.keys()) + list(keyDict.keys())) + ") VALUES ("
+            query += ", ".join(["?"] * (len(valueDict) + len(keyDict))) + ")"
+            self.action(query, list(valueDict.values()) + list(keyDict.values()), suppress="UNIQUE")
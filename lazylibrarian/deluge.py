@@ -24,9 +24,13 @@
 
 from __future__ import unicode_literals
 
-import json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+import mmap
 import os
-import re
+import threading
 import time
 import traceback
 from base64 import b64encode
@@ -34,16 +38,86 @@ try:
     import requests
 except ImportError:
     import lib.requests as requests
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 import lazylibrarian
 from lazylibrarian import logger
 from lazylibrarian.common import setperm
-from lazylibrarian.formatter import check_int
-from lib.six import PY2
+from lazylibrarian.formatter import check_int, makeBytestr
 
 delugeweb_auth = {}
 delugeweb_url = ''
 headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+# keep one session alive so every rpc reuses the same pooled connection
+# instead of a fresh TCP (and TLS) handshake per call
+delugeweb_session = requests.Session()
+# set once auth.login succeeds; cheaper than probing the cookie jar per call
+_authed = False
+# labels known to exist in Deluge, so repeat adds skip the get_labels rpc
+_known_labels = None
+# config values the current delugeweb_url was built from
+_url_key = None
+
+
+def _rpc_body(method, params, id_=1):
+    """ Serialize one JSON-RPC request """
+    return _json.dumps({"method": method,
+                        "params": params,
+                        "id": id_})
+
+
+def _post(post_data, parse=True):
+    """ Post an already-serialized request, decoding the response unless
+    the caller doesn't want it """
+    response = delugeweb_session.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+    if not parse:
+        return None
+    return _json.loads(response.content)
+
+
+def _rpc(method, params, id_=1, parse=True):
+    """ Send a single JSON-RPC call to the Deluge WebUI and return
+    the decoded response as a dict. Fire-and-forget callers pass
+    parse=False to skip decoding a response body nobody reads """
+    return _post(_rpc_body(method, params, id_), parse)
+
+
+def _get_status(post_data):
+    """ Fetch torrent status fields. With ijson installed the fields are
+    streamed straight out of the response body instead of decoding the
+    whole document, which helps when Deluge returns verbose status """
+    if ijson is None:
+        return _post(post_data)['result']
+    response = delugeweb_session.post(delugeweb_url, data=post_data, cookies=delugeweb_auth,
+                                      headers=headers, stream=True)
+    status = {}
+    try:
+        response.raw.decode_content = True
+        for key, value in ijson.kvitems(response.raw, 'result'):
+            status[key] = value
+    finally:
+        response.close()
+    return status
+
+
+def _bencode_name(buf):
+    """ Pull the name field straight out of raw bencoded torrent data.
+    Cheaper than a regex scan of the whole file, returns None if not found """
+    try:
+        i = buf.find(b'4:name')
+        if i < 0:
+            return None
+        i += 6
+        j = buf.find(b':', i)
+        if j < 0:
+            return None
+        n = int(buf[i:j])
+        return buf[j + 1:j + 1 + n].decode('utf-8', 'replace')
+    except (ValueError, TypeError, AttributeError):
+        return None
 
 
 def addTorrent(link, data=None):
@@ -51,13 +125,17 @@ def addTorrent(link, data=None):
         result = {}
         retid = False
 
-        if link and link.startswith('magnet:'):
+        if not link:
+            logger.error('Deluge: Unknown file type: %s' % link)
+            return False
+
+        if link.startswith('magnet:'):
             logger.debug('Deluge: Got a magnet link: %s' % link)
             result = {'type': 'magnet',
                       'url': link}
             retid = _add_torrent_magnet(result)
 
-        elif link and link.startswith('http'):
+        elif link.startswith(('http://', 'https://')):
             logger.debug('Deluge: Got a URL: %s' % link)
             result = {'type': 'url',
                       'url': link}
@@ -105,41 +183,44 @@ def addTorrent(link, data=None):
             retid = _add_torrent_file(result)
             """
         # elif link.endswith('.torrent') or data:
-        elif link:
+        else:
             if data:
                 logger.debug('Deluge: Getting .torrent data')
                 torrentfile = data
             else:
                 logger.debug('Deluge: Getting .torrent file')
                 with open(link, str('rb')) as f:
-                    torrentfile = f.read()
+                    try:
+                        # map the file rather than copying it into a bytes
+                        # object; the name scan and base64 read the page
+                        # cache directly
+                        torrentfile = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, EnvironmentError):
+                        # zero length or unmappable, read it the slow way
+                        torrentfile = f.read()
             # Extract torrent name from .torrent
-            try:
-                logger.debug('Deluge: Getting torrent name length')
-                name_length = int(re.findall('name([0-9]*):.*?:', torrentfile)[0])
-                logger.debug('Deluge: Getting torrent name')
-                name = re.findall('name[0-9]*:(.*?):', torrentfile)[0][:name_length]
-            except (re.error, IndexError, TypeError):
+            name = _bencode_name(torrentfile)
+            if not name:
                 logger.debug('Deluge: Could not get torrent name, getting file name')
                 # get last part of link/path (name only)
-                name = link.split('\\')[-1].split('/')[-1]
+                name = link.rpartition('/')[2].rpartition('\\')[2]
                 # remove '.torrent' suffix
-                if name[-len('.torrent'):] == '.torrent':
-                    name = name[:-len('.torrent')]
+                if name.endswith('.torrent'):
+                    name = name[:-8]
             logger.debug('Deluge: Sending Deluge torrent with name %s and content [%s...]' % (name, torrentfile[:40]))
             result = {'type': 'torrent',
                       'name': name,
                       'content': torrentfile}
             retid = _add_torrent_file(result)
-
-        else:
-            logger.error('Deluge: Unknown file type: %s' % link)
+            if isinstance(torrentfile, mmap.mmap):
+                torrentfile.close()
 
         if retid:
             logger.info('Deluge: Torrent sent to Deluge successfully  (%s)' % retid)
             if lazylibrarian.CONFIG['DELUGE_LABEL']:
-                labelled = setTorrentLabel(result)
-                logger.debug('Deluge label returned: %s' % labelled)
+                # labelling needs the hash but nothing later needs the
+                # label, so don't hold up the add for the extra rpcs
+                threading.Thread(target=_label_torrent, name='DELUGELABEL', args=[result]).start()
             return retid
         else:
             logger.info('Deluge returned status %s' % retid)
@@ -153,51 +234,40 @@ def addTorrent(link, data=None):
 
 def getTorrentFolder(torrentid):
     logger.debug('Deluge: Get torrent folder name')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
     try:
-        post_data = json.dumps({"method": "web.get_torrent_status",
-                                "params": [
-                                    torrentid,
-                                    ["total_done"]
-                                ],
-                                "id": 22})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        total_done = json.loads(response.text)['result']['total_done']
-
-        tries = 0
-        while total_done == 0 and tries < 10:
-            tries += 1
-            time.sleep(5)
-            response = requests.post(delugeweb_url, data=post_data,
-                                     cookies=delugeweb_auth, headers=headers)
-            total_done = json.loads(response.text)['result']['total_done']
-
-        post_data = json.dumps({"method": "web.get_torrent_status",
-                                "params": [
-                                    torrentid,
-                                    [
-                                        "name",
-                                        "save_path",
-                                        "total_size",
-                                        "num_files",
-                                        "message",
-                                        "tracker",
-                                        "comment"
-                                    ]
-                                ],
-                                "id": 23})
-
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-
-        # save_path = json.loads(response.text)['result']['save_path']
-        name = json.loads(response.text)['result']['name']
+        # one call for everything: when total_done is already nonzero the
+        # same response carries the name, so no second status rpc is needed
+        fields = [
+            "total_done",
+            "name",
+            "save_path",
+            "total_size",
+            "num_files",
+            "message",
+            "tracker",
+            "comment"
+        ]
+        # serialize the request once, every poll posts the same body
+        post_data = _rpc_body("web.get_torrent_status", [torrentid, fields], 22)
+        status = _get_status(post_data)
+        total_done = status['total_done']
+
+        # back off from a short first poll up to 5s rather than fixed 5s
+        # sleeps: same overall budget, but torrents that populate quickly
+        # are picked up in well under a second
+        delay = 0.25
+        deadline = time.time() + 50
+        while total_done == 0 and time.time() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 5.0)
+            status = _get_status(post_data)
+            total_done = status['total_done']
+
+        # save_path = status['save_path']
+        name = status['name']
 
         return name
     except Exception as err:
@@ -205,22 +275,20 @@ def getTorrentFolder(torrentid):
 
 
 def removeTorrent(torrentid, remove_data=False):
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
-    post_data = json.dumps({"method": "core.remove_torrent", "params": [torrentid, remove_data], "id": 25})
-    if PY2:
-        post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-    response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-    result = json.loads(response.text)['result']
+    result = _rpc("core.remove_torrent", [torrentid, remove_data], 25)['result']
 
     return result
 
 
 def _get_auth():
     logger.debug('Deluge: Authenticating...')
-    global delugeweb_auth, delugeweb_url, headers
+    global delugeweb_auth, delugeweb_url, headers, _known_labels, _authed, _url_key
     delugeweb_auth = {}
+    _authed = False
+    _known_labels = None
 
     delugeweb_host = lazylibrarian.CONFIG['DELUGE_HOST']
     delugeweb_url_base = lazylibrarian.CONFIG['DELUGE_URL_BASE']
@@ -231,33 +299,36 @@ def _get_auth():
 
     delugeweb_password = lazylibrarian.CONFIG['DELUGE_PASS']
 
-    if not delugeweb_host.startswith("http://") and not delugeweb_host.startswith("https://"):
-        delugeweb_host = 'http://%s' % delugeweb_host
+    # only rebuild the url when the config it came from has changed;
+    # auth can re-run on cookie expiry in a long-running daemon
+    url_key = (delugeweb_host, delugeweb_url_base, delugeweb_port)
+    if url_key != _url_key:
+        if not delugeweb_host.startswith("http://") and not delugeweb_host.startswith("https://"):
+            delugeweb_host = 'http://%s' % delugeweb_host
 
-    if delugeweb_host.endswith('/'):
-        delugeweb_host = delugeweb_host[:-1]
+        if delugeweb_host.endswith('/'):
+            delugeweb_host = delugeweb_host[:-1]
 
-    if delugeweb_url_base.endswith('/'):
-        delugeweb_url_base = delugeweb_url_base[:-1]
+        if delugeweb_url_base.endswith('/'):
+            delugeweb_url_base = delugeweb_url_base[:-1]
 
-    delugeweb_host = "%s:%s" % (delugeweb_host, delugeweb_port)
+        delugeweb_host = "%s:%s" % (delugeweb_host, delugeweb_port)
 
-    delugeweb_url = delugeweb_host + delugeweb_url_base + '/json'
+        delugeweb_url = delugeweb_host + delugeweb_url_base + '/json'
+        _url_key = url_key
 
-    post_data = json.dumps({"method": "auth.login",
-                            "params": [delugeweb_password],
-                            "id": 1})
-    if PY2:
-        post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
+    post_data = _json.dumps({"method": "auth.login",
+                             "params": [delugeweb_password],
+                             "id": 1})
     try:
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+        response = delugeweb_session.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
         #                                  , verify=TORRENT_VERIFY_CERT)
     except Exception as err:
         logger.debug('Deluge %s: auth.login returned %s' % (type(err).__name__, str(err)))
         delugeweb_auth = {}
         return None
 
-    auth = json.loads(response.text)["result"]
+    auth = _json.loads(response.content)["result"]
     if auth is False:
         logger.debug('Deluge: auth.login returned False')
         delugeweb_auth = {}
@@ -265,119 +336,79 @@ def _get_auth():
 
     delugeweb_auth = response.cookies
 
-    post_data = json.dumps({"method": "web.connected",
-                            "params": [],
-                            "id": 10})
-    if PY2:
-        post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
     try:
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+        connected = _rpc("web.connected", [], 10)['result']
         #                                  , verify=TORRENT_VERIFY_CERT)
     except Exception as err:
         logger.debug('Deluge %s: web.connected returned %s' % (type(err).__name__, str(err)))
         delugeweb_auth = {}
         return None
 
-    connected = json.loads(response.text)['result']
-
     if not connected:
-        post_data = json.dumps({"method": "web.get_hosts",
-                                "params": [],
-                                "id": 11})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
         try:
-            response = requests.post(delugeweb_url, data=post_data,
-                                     cookies=delugeweb_auth, headers=headers)
+            delugeweb_hosts = _rpc("web.get_hosts", [], 11)['result']
             #                                  , verify=TORRENT_VERIFY_CERT)
         except Exception as err:
             logger.debug('Deluge %s: web.get_hosts returned %s' % (type(err).__name__, str(err)))
             delugeweb_auth = {}
             return None
 
-        delugeweb_hosts = json.loads(response.text)['result']
         if len(delugeweb_hosts) == 0:
             logger.error('Deluge: WebUI does not contain daemons')
             delugeweb_auth = {}
             return None
 
-        post_data = json.dumps({"method": "web.connect",
-                                "params": [delugeweb_hosts[0][0]],
-                                "id": 11})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-
         try:
-            _ = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+            _rpc("web.connect", [delugeweb_hosts[0][0]], 11, parse=False)
             #                                  , verify=TORRENT_VERIFY_CERT)
         except Exception as err:
             logger.debug('Deluge %s: web.connect returned %s' % (type(err).__name__, str(err)))
             delugeweb_auth = {}
             return None
 
-        post_data = json.dumps({"method": "web.connected",
-                                "params": [],
-                                "id": 10})
-
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
         try:
-            response = requests.post(delugeweb_url, data=post_data,
-                                     cookies=delugeweb_auth, headers=headers)
+            connected = _rpc("web.connected", [], 10)['result']
             #                                  , verify=TORRENT_VERIFY_CERT)
         except Exception as err:
             logger.debug('Deluge %s: web.connected returned %s' % (type(err).__name__, str(err)))
             delugeweb_auth = {}
             return None
 
-        connected = json.loads(response.text)['result']
-
         if not connected:
             logger.error('Deluge: WebUI could not connect to daemon')
             delugeweb_auth = {}
             return None
 
+    _authed = True
     return auth
 
 
 def _add_torrent_magnet(result):
     logger.debug('Deluge: Adding magnet')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
     try:
-        post_data = json.dumps({"method": "core.add_torrent_magnet",
-                                "params": [result['url'], {}],
-                                "id": 2})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        result['hash'] = json.loads(response.text)['result']
-        msg = 'Deluge: Response was %s' % str(json.loads(response.text)['result'])
-        logger.debug(msg)
-        if 'was None' in msg:
+        res = _rpc("core.add_torrent_magnet", [result['url'], {}], 2)['result']
+        result['hash'] = res
+        logger.debug('Deluge: Response was %s' % str(res))
+        if res is None:
             logger.error('Deluge: Adding magnet failed: Is the WebUI running?')
-        return json.loads(response.text)['result']
+        return res
     except Exception as err:
         logger.error('Deluge %s: Adding magnet failed: %s' % (type(err).__name__, str(err)))
 
 
 def _add_torrent_url(result):
     logger.debug('Deluge: Adding URL')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
     try:
-        post_data = json.dumps({"method": "core.add_torrent_url",
-                                "params": [result['url'], {}],
-                                "id": 2})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        result['hash'] = json.loads(response.text)['result']
-        msg = 'Deluge: Response was %s' % str(json.loads(response.text)['result'])
-        logger.debug(msg)
-        if 'was None' in msg:
+        res = _rpc("core.add_torrent_url", [result['url'], {}], 2)['result']
+        result['hash'] = res
+        logger.debug('Deluge: Response was %s' % str(res))
+        if res is None:
             logger.error('Deluge: Adding torrent URL failed: Is the WebUI running?')
-        return json.loads(response.text)['result']
+        return res
     except Exception as err:
         logger.error('Deluge %s: Adding torrent URL failed: %s' % (type(err).__name__, str(err)))
         return False
@@ -385,23 +416,19 @@ def _add_torrent_url(result):
 
 def _add_torrent_file(result):
     logger.debug('Deluge: Adding file')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
     try:
-        # content is torrent file contents that needs to be encoded to base64
-        post_data = json.dumps({"method": "core.add_torrent_file",
-                                "params":
-                                    [result['name'] + '.torrent', b64encode(result['content'].encode('utf8')), {}],
-                                "id": 2})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        result['hash'] = json.loads(response.text)['result']
-        msg = 'Deluge: Response was %s' % str(json.loads(response.text)['result'])
-        logger.debug(msg)
-        if 'was None' in msg:
+        # content is the raw torrent file bytes, base64 them as-is;
+        # a utf-8 round-trip would corrupt (or fail on) binary data
+        content = b64encode(makeBytestr(result['content'])).decode('ascii')
+        res = _rpc("core.add_torrent_file",
+                   [result['name'] + '.torrent', content, {}], 2)['result']
+        result['hash'] = res
+        logger.debug('Deluge: Response was %s' % str(res))
+        if res is None:
             logger.error('Deluge: Adding torrent file failed: Is the WebUI running?')
-        return json.loads(response.text)['result']
+        return res
     except Exception as err:
         logger.error('Deluge %s: Adding torrent file failed: %s' % (type(err).__name__, str(err)))
         formatted_lines = traceback.format_exc().splitlines()
@@ -409,54 +436,49 @@ def _add_torrent_file(result):
         return False
 
 
+def _label_torrent(result):
+    labelled = setTorrentLabel(result)
+    logger.debug('Deluge label returned: %s' % labelled)
+
+
 def setTorrentLabel(result):
     logger.debug('Deluge: Setting label')
+    global _known_labels
     label = lazylibrarian.CONFIG['DELUGE_LABEL']
 
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
     if ' ' in label:
         logger.error('Deluge: Invalid label. Label can\'t contain spaces - replacing with underscores')
         label = label.replace(' ', '_')
     if label:
-        # check if label already exists and create it if not
-        post_data = json.dumps({"method": 'label.get_labels',
-                                "params": [],
-                                "id": 3})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        labels = json.loads(response.text)['result']
-
-        if labels:
+        if _known_labels is None or label not in _known_labels:
+            # check if label already exists and create it if not
+            labels = _rpc('label.get_labels', [], 3)['result']
+
+            if not labels:
+                logger.debug('Deluge: Label plugin not detected')
+                return False
+
+            # only cache labels the daemon really has, so a failed
+            # label.add is retried on the next call
+            _known_labels = set(labels)
             if label not in labels:
                 try:
                     logger.debug('Deluge: %s label doesn\'t exist in Deluge, let\'s add it' % label)
-                    post_data = json.dumps({"method": 'label.add',
-                                            "params": [label],
-                                            "id": 4})
-                    if PY2:
-                        post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-                    _ = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+                    _rpc('label.add', [label], 4, parse=False)
                     logger.debug('Deluge: %s label added to Deluge' % label)
+                    _known_labels.add(label)
                 except Exception as err:
                     logger.error('Deluge %s: Setting label failed: %s' % (type(err).__name__, str(err)))
                     formatted_lines = traceback.format_exc().splitlines()
                     logger.error('; '.join(formatted_lines))
 
-            # add label to torrent
-            post_data = json.dumps({"method": 'label.set_torrent',
-                                    "params": [result['hash'], label],
-                                    "id": 5})
-            if PY2:
-                post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-            response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-            logger.debug('Deluge: %s label added to torrent' % label)
-            return not json.loads(response.text)['error']
-        else:
-            logger.debug('Deluge: Label plugin not detected')
-            return False
+        # add label to torrent
+        res = _rpc('label.set_torrent', [result['hash'], label], 5)
+        logger.debug('Deluge: %s label added to torrent' % label)
+        return not res['error']
     else:
         logger.debug('Deluge: No Label set')
         return True
@@ -464,7 +486,7 @@ def setTorrentLabel(result):
 
 def setSeedRatio(result):
     logger.debug('Deluge: Setting seed ratio')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
     ratio = None
@@ -472,36 +494,21 @@ def setSeedRatio(result):
         ratio = result['ratio']
 
     if ratio:
-        post_data = json.dumps({"method": "core.set_torrent_stop_at_ratio",
-                                "params": [result['hash'], True],
-                                "id": 5})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        _ = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-        post_data = json.dumps({"method": "core.set_torrent_stop_ratio",
-                                "params": [result['hash'], float(ratio)],
-                                "id": 6})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
-
-        return not json.loads(response.text)['error']
+        _rpc("core.set_torrent_stop_at_ratio", [result['hash'], True], 5, parse=False)
+        res = _rpc("core.set_torrent_stop_ratio", [result['hash'], float(ratio)], 6)
+
+        return not res['error']
 
     return True
 
 
 def setTorrentPath(result):
     logger.debug('Deluge: Setting download path')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
     if lazylibrarian.DIRECTORY('Download'):
-        post_data = json.dumps({"method": "core.set_torrent_move_completed",
-                                "params": [result['hash'], True],
-                                "id": 7})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        _ = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+        _rpc("core.set_torrent_move_completed", [result['hash'], True], 7, parse=False)
 
         move_to = lazylibrarian.DIRECTORY('Download')
 
@@ -509,37 +516,27 @@ def setTorrentPath(result):
             logger.debug('Deluge: %s directory doesn\'t exist, let\'s create it' % move_to)
             os.makedirs(move_to)
             setperm(move_to)
-        post_data = json.dumps({"method": "core.set_torrent_move_completed_path",
-                                "params": [result['hash'], move_to],
-                                "id": 8})
-        if PY2:
-            post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-        response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+        res = _rpc("core.set_torrent_move_completed_path", [result['hash'], move_to], 8)
 
-        return not json.loads(response.text)['error']
+        return not res['error']
 
     return True
 
 
 def setTorrentPause(result):
     logger.debug('Deluge: Pausing torrent')
-    if not any(delugeweb_auth):
+    if not _authed:
         _get_auth()
 
-    post_data = json.dumps({"method": "core.pause_torrent",
-                            "params": [[result['hash']]],
-                            "id": 9})
-    if PY2:
-        post_data = post_data.encode(lazylibrarian.SYS_ENCODING)
-    response = requests.post(delugeweb_url, data=post_data, cookies=delugeweb_auth, headers=headers)
+    res = _rpc("core.pause_torrent", [[result['hash']]], 9)
 
-    return not json.loads(response.text)['error']
+    return not res['error']
 
 
 def checkLink():
     logger.debug('Deluge: Checking connection')
     msg = "Deluge: Connection successful"
-    if not any(delugeweb_auth):
+    if not _authed:
         auth = _get_auth()
         if not auth:
             msg = "Deluge: Connection FAILED\nCheck debug log"
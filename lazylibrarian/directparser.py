@@ -14,8 +14,8 @@
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
 import traceback
-import urllib
-import urlparse
+import urllib.parse
+import urllib.parse as urlparse
 
 import lazylibrarian
 from lazylibrarian import logger
@@ -96,7 +96,7 @@ def GEN(book=None, prov=None, test=False):
             params['page'] = page
 
         providerurl = url_fix(host + "/%s" % search)
-        searchURL = providerurl + "?%s" % urllib.urlencode(params)
+        searchURL = providerurl + "?%s" % urllib.parse.urlencode(params)
 
         next_page = False
         result, success = fetchURL(searchURL)
@@ -20,6 +20,7 @@ import string
 import time
 import unicodedata
 import hashlib
+from functools import lru_cache
 from lib.six import PY2, text_type
 import lazylibrarian
 
@@ -281,9 +282,12 @@ def is_valid_isbn(isbn):
     return False
 
 
+@lru_cache(maxsize=1024)
 def is_valid_booktype(filename, booktype=None):
     """
     Check if filename extension is one we want
+    Cached on (filename, booktype); cleared when the config is rewritten
+    as the answer depends on the configured type lists
     """
     if booktype == 'mag':  # default is book
         booktype_list = getList(lazylibrarian.CONFIG['MAG_TYPE'])
@@ -446,13 +450,29 @@ def cleanName(name, extras=None):
 
 
 def unaccented(str_or_unicode):
-    return unaccented_str(str_or_unicode).decode(lazylibrarian.SYS_ENCODING)
+    if _is_ascii(str_or_unicode):
+        return str_or_unicode
+    if PY2:
+        return unaccented_str(str_or_unicode).decode(lazylibrarian.SYS_ENCODING)
+    return unaccented_str(str_or_unicode)
     # returns unicode
 
 
+def _is_ascii(text):
+    # pure ascii text is the common case and has nothing to normalize
+    if not PY2 and isinstance(text, text_type):
+        try:
+            return text.isascii()
+        except AttributeError:  # python < 3.7
+            pass
+    return False
+
+
 def unaccented_str(str_or_unicode):
     if not str_or_unicode:
-        return ''.encode('ASCII')  # ensure bytestring for python3
+        return ''.encode('ASCII') if PY2 else ''
+    if _is_ascii(str_or_unicode):
+        return str_or_unicode
     try:
         cleaned = unicodedata.normalize('NFKD', str_or_unicode)
     except TypeError:
@@ -473,8 +493,8 @@ def unaccented_str(str_or_unicode):
         return stripped.encode('ASCII', 'ignore')
         # return bytestring
     else:
-        return stripped.decode(lazylibrarian.SYS_ENCODING)
-        # return unicode
+        return stripped.encode('ASCII', 'ignore').decode()
+        # return str
 
 
 def replace_all(text, dic):
@@ -19,7 +19,7 @@
 
 import re
 import traceback
-import urllib
+import urllib.parse
 try:
     import requests
 except ImportError:
@@ -82,7 +82,7 @@ class GoogleBooks:
             for api_value in api_strings:
                 set_url = self.url
                 if api_value == "isbn:":
-                    set_url = set_url + urllib.quote(api_value + searchterm)
+                    set_url = set_url + urllib.parse.quote(api_value + searchterm)
                 elif api_value == 'intitle:':
                     searchterm = fullterm
                     if title:  # just search for title
@@ -92,7 +92,7 @@ class GoogleBooks:
                     searchterm = searchterm.replace("'", "").replace('"', '').strip()  # and no quotes
                     if PY2:
                         searchterm = searchterm.encode(lazylibrarian.SYS_ENCODING)
-                    set_url = set_url + urllib.quote(api_value + '"' + searchterm + '"')
+                    set_url = set_url + urllib.parse.quote(api_value + '"' + searchterm + '"')
                 elif api_value == 'inauthor:':
                     searchterm = fullterm
                     if authorname:
@@ -100,7 +100,7 @@ class GoogleBooks:
                     searchterm = searchterm.strip()
                     if PY2:
                         searchterm = searchterm.encode(lazylibrarian.SYS_ENCODING)
-                    set_url = set_url + urllib.quote(api_value + '"' + searchterm + '"')
+                    set_url = set_url + urllib.parse.quote(api_value + '"' + searchterm + '"')
 
                 startindex = 0
                 resultcount = 0
@@ -112,7 +112,7 @@ class GoogleBooks:
                     while startindex < number_results:
 
                         self.params['startIndex'] = startindex
-                        URL = set_url + '&' + urllib.urlencode(self.params)
+                        URL = set_url + '&' + urllib.parse.urlencode(self.params)
 
                         try:
                             jsonresults, in_cache = get_json_request(URL)
@@ -309,7 +309,7 @@ class GoogleBooks:
         try:
             logger.debug('[%s] Now processing books with Google Books API' % authorname)
             # google doesnt like accents in author names
-            set_url = self.url + urllib.quote('inauthor:"%s"' % unaccented_str(authorname))
+            set_url = self.url + urllib.parse.quote('inauthor:"%s"' % unaccented_str(authorname))
 
             api_hits = 0
             gr_lang_hits = 0
@@ -339,7 +339,7 @@ class GoogleBooks:
                 while startindex < number_results:
 
                     self.params['startIndex'] = startindex
-                    URL = set_url + '&' + urllib.urlencode(self.params)
+                    URL = set_url + '&' + urllib.parse.urlencode(self.params)
 
                     try:
                         jsonresults, in_cache = get_json_request(URL, useCache=not refresh)
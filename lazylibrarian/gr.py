@@ -17,7 +17,7 @@ import re
 import time
 import traceback
 import unicodedata
-import urllib
+import urllib.parse
 try:
     import requests
 except ImportError:
@@ -59,8 +59,8 @@ class GoodReads:
 
             if PY2:
                 searchterm = searchterm.encode(lazylibrarian.SYS_ENCODING)
-            url = urllib.quote_plus(searchterm)
-            set_url = 'https://www.goodreads.com/search.xml?q=' + url + '&' + urllib.urlencode(self.params)
+            url = urllib.parse.quote_plus(searchterm)
+            set_url = 'https://www.goodreads.com/search.xml?q=' + url + '&' + urllib.parse.urlencode(self.params)
             logger.debug('Now searching GoodReads API with searchterm: %s' % searchterm)
             # logger.debug('Searching for %s at: %s' % (searchterm, set_url))
 
@@ -233,8 +233,8 @@ class GoodReads:
     def find_author_id(self, refresh=False):
         author = self.name
         author = formatAuthorName(unaccented(author))
-        URL = 'https://www.goodreads.com/api/author_url/' + urllib.quote(author) + \
-              '?' + urllib.urlencode(self.params)
+        URL = 'https://www.goodreads.com/api/author_url/' + urllib.parse.quote(author) + \
+              '?' + urllib.parse.urlencode(self.params)
 
         # googlebooks gives us author names with long form unicode characters
         author = makeUnicode(author)  # ensure it's unicode
@@ -269,7 +269,7 @@ class GoodReads:
 
     def get_author_info(self, authorid=None):
 
-        URL = 'https://www.goodreads.com/author/show/' + authorid + '.xml?' + urllib.urlencode(self.params)
+        URL = 'https://www.goodreads.com/author/show/' + authorid + '.xml?' + urllib.parse.urlencode(self.params)
         author_dict = {}
 
         try:
@@ -318,7 +318,7 @@ class GoodReads:
             gb_lang_change = 0
             cache_hits = 0
             not_cached = 0
-            URL = 'https://www.goodreads.com/author/list/' + authorid + '.xml?' + urllib.urlencode(self.params)
+            URL = 'https://www.goodreads.com/author/list/' + authorid + '.xml?' + urllib.parse.urlencode(self.params)
 
             # Artist is loading
             myDB = database.DBConnection()
@@ -448,7 +448,7 @@ class GoodReads:
                                     if book.find(find_field).text:
                                         BOOK_URL = 'https://www.goodreads.com/book/show?id=' + \
                                                    book.find(find_field).text + \
-                                                   '&' + urllib.urlencode(self.params)
+                                                   '&' + urllib.parse.urlencode(self.params)
                                         logger.debug("Book URL: " + BOOK_URL)
 
                                         time_now = int(time.time())
@@ -727,7 +727,7 @@ class GoodReads:
                         logger.warn('Maximum books page search reached, still more results available')
                     else:
                         URL = 'https://www.goodreads.com/author/list/' + authorid + '.xml?' + \
-                              urllib.urlencode(self.params) + '&page=' + str(loopCount)
+                              urllib.parse.urlencode(self.params) + '&page=' + str(loopCount)
                         resultxml = None
                         try:
                             rootxml, in_cache = get_xml_request(URL, useCache=not refresh)
@@ -799,7 +799,7 @@ class GoodReads:
     def find_book(self, bookid=None):
         myDB = database.DBConnection()
 
-        URL = 'https://www.goodreads.com/book/show/' + bookid + '?' + urllib.urlencode(self.params)
+        URL = 'https://www.goodreads.com/book/show/' + bookid + '?' + urllib.parse.urlencode(self.params)
 
         try:
             rootxml, in_cache = get_xml_request(URL)
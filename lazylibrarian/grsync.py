@@ -18,13 +18,16 @@
 import threading
 import time
 import traceback
-import urllib
-import urlparse
+import urllib.parse as urlparse
 import xml.dom.minidom
 from string import Template
 
 import lazylibrarian
-import lib.oauth2 as oauth
+# noinspection PyBroadException
+try:
+    import lib.oauth2 as oauth
+except Exception:  # the vendored oauth2/httplib2 pair is still python2-only
+    oauth = None
 from lazylibrarian import logger, database
 from lazylibrarian.formatter import plural, getList
 from lazylibrarian.gr import GoodReads
@@ -43,6 +46,8 @@ class grauth:
     @staticmethod
     def goodreads_oauth1():
         global client, request_token, consumer
+        if oauth is None:
+            return "Goodreads sync is unavailable, no oauth2 library"
         if lazylibrarian.CONFIG['GR_API'] == 'ckvsiSDsuqh7omh74ZZ6Q':
             msg = "Please get your own personal GoodReads api key from https://www.goodreads.com/api/keys and try again"
             return msg
@@ -146,7 +151,7 @@ class grauth:
                 current_page = current_page + 1
                 page_shelves = 0
                 shelf_template = Template('${base}/shelf/list.xml?user_id=${user_id}&key=${key}&page=${page}')
-                body = urllib.urlencode({})
+                body = urlparse.urlencode({})
                 headers = {'Content-Type': 'application/x-www-form-urlencoded'}
                 request_url = shelf_template.substitute(base='https://www.goodreads.com', user_id=user_id,
                                                         page=current_page, key=lazylibrarian.CONFIG['GR_API'])
@@ -203,7 +208,7 @@ class grauth:
             lazylibrarian.LAST_GOODREADS = time_now
 
         if follow:
-            body = urllib.urlencode({'id': authorid, 'format': 'xml'})
+            body = urlparse.urlencode({'id': authorid, 'format': 'xml'})
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
             try:
                 response, content = client.request('%s/author_followings' % 'https://www.goodreads.com', 'POST', body,
@@ -211,7 +216,7 @@ class grauth:
             except Exception as e:
                 return False, "Exception in client.request: %s %s" % (type(e).__name__, str(e))
         else:
-            body = urllib.urlencode({'format': 'xml'})
+            body = urlparse.urlencode({'format': 'xml'})
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
             try:
                 response, content = client.request('%s/author_followings/%s' % ('https://www.goodreads.com', authorid),
@@ -242,7 +247,7 @@ class grauth:
         user_id = self.getUserId()
 
         # could also pass [featured] [exclusive_flag] [sortable_flag] all default to False
-        body = urllib.urlencode({'user_shelf[name]': shelf.lower()})
+        body = urlparse.urlencode({'user_shelf[name]': shelf.lower()})
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         time_now = int(time.time())
         if time_now <= lazylibrarian.LAST_GOODREADS:
@@ -344,7 +349,7 @@ class grauth:
         data = '${base}/review/list?format=xml&v=2&id=${user_id}&sort=author&order=a'
         data += '&key=${key}&page=${page}&per_page=100&shelf=${shelf_name}'
         owned_template = Template(data)
-        body = urllib.urlencode({})
+        body = urlparse.urlencode({})
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         request_url = owned_template.substitute(base='https://www.goodreads.com', user_id=user_id, page=page,
                                                 key=lazylibrarian.CONFIG['GR_API'], shelf_name=shelf_name)
@@ -374,9 +379,9 @@ class grauth:
     def BookToList(book_id, shelf_name, action='add'):
         global client
         if action == 'remove':
-            body = urllib.urlencode({'name': shelf_name, 'book_id': book_id, 'a': 'remove'})
+            body = urlparse.urlencode({'name': shelf_name, 'book_id': book_id, 'a': 'remove'})
         else:
-            body = urllib.urlencode({'name': shelf_name, 'book_id': book_id})
+            body = urlparse.urlencode({'name': shelf_name, 'book_id': book_id})
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         time_now = int(time.time())
         if time_now <= lazylibrarian.LAST_GOODREADS:
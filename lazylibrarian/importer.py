@@ -13,7 +13,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
-import Queue
+import queue as Queue
 import threading
 import traceback
 from operator import itemgetter
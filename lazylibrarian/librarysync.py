@@ -16,7 +16,7 @@
 import os
 import re
 import traceback
-import urllib
+import urllib.parse
 import shutil
 from xml.etree import ElementTree
 from lib.six import PY2
@@ -661,8 +661,8 @@ def LibraryScan(startdir=None, library='eBook', authid=None, remove=True):
                                         searchname = cleanName(unaccented(searchname))
                                         if PY2:
                                             searchname = searchname.encode(lazylibrarian.SYS_ENCODING)
-                                        searchterm = urllib.quote_plus(searchname)
-                                        set_url = base_url + searchterm + '&' + urllib.urlencode(params)
+                                        searchterm = urllib.parse.quote_plus(searchname)
+                                        set_url = base_url + searchterm + '&' + urllib.parse.urlencode(params)
                                         # noinspection PyBroadException
                                         try:
                                             rootxml, in_cache = get_xml_request(set_url)
@@ -13,7 +13,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
-import urllib
+import urllib.parse
 
 import lazylibrarian
 from lazylibrarian import logger, database
@@ -130,7 +130,7 @@ def searchItem(item=None, bookid=None, cat=None):
                     if not mode == 'torznab' and not mode == 'direct':  # what is this split for??
                         url = url.split('?')[0]
                 result = {'score': score, 'title': title, 'provider': provider, 'size': size, 'date': date,
-                          'url': urllib.quote_plus(url), 'mode': mode}
+                          'url': urllib.parse.quote_plus(url), 'mode': mode}
 
                 searchresults.append(result)
 
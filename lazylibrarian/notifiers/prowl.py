@@ -1,5 +1,5 @@
-from httplib import HTTPSConnection
-from urllib import urlencode
+from http.client import HTTPSConnection
+from urllib.parse import urlencode
 
 import lazylibrarian
 from lazylibrarian import logger
@@ -20,16 +20,21 @@ import lazylibrarian
 
 from lazylibrarian import logger, common, formatter
 
-# parse_qsl moved to urlparse module in v2.6
+# parse_qsl moved to urllib.parse in python 3
 # noinspection PyBroadException
 try:
-    from urlparse import parse_qsl  # @UnusedImport
+    from urllib.parse import parse_qsl  # @UnusedImport
 except Exception:
     # noinspection PyDeprecation
-    from cgi import parse_qsl  # @Reimport
+    from urlparse import parse_qsl  # @Reimport
 
-import lib.oauth2 as oauth
-import lib.pythontwitter as twitter
+# noinspection PyBroadException
+try:
+    import lib.oauth2 as oauth
+    import lib.pythontwitter as twitter
+except Exception:  # the vendored oauth2/pythontwitter pair is still python2-only
+    oauth = None
+    twitter = None
 
 
 class TwitterNotifier:
@@ -58,6 +63,10 @@ class TwitterNotifier:
 
     def _get_authorization(self):
 
+        if oauth is None:
+            logger.error('Twitter notifications are unavailable, no oauth2 library')
+            return None
+
         _ = oauth.SignatureMethod_HMAC_SHA1()
         oauth_consumer = oauth.Consumer(key=self.consumer_key, secret=self.consumer_secret)
         oauth_client = oauth.Client(oauth_consumer)
@@ -82,6 +91,10 @@ class TwitterNotifier:
                          'oauth_token_secret': lazylibrarian.CONFIG['TWITTER_PASSWORD'],
                          'oauth_callback_confirmed': 'true'}
 
+        if oauth is None:
+            logger.error('Twitter notifications are unavailable, no oauth2 library')
+            return False
+
         token = oauth.Token(request_token['oauth_token'], request_token['oauth_token_secret'])
         token.set_verifier(key)
 
@@ -117,6 +130,10 @@ class TwitterNotifier:
         access_token_key = lazylibrarian.CONFIG['TWITTER_USERNAME']
         access_token_secret = lazylibrarian.CONFIG['TWITTER_PASSWORD']
 
+        if twitter is None:
+            logger.error('Twitter notifications are unavailable, no pythontwitter library')
+            return False
+
         logger.info(u"Sending tweet: " + message)
 
         api = twitter.Api(username, password, access_token_key, access_token_secret)
@@ -20,8 +20,8 @@
 # along with LazyLibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
 
-import httplib
-import xmlrpclib
+import http.client as httplib
+import xmlrpc.client as xmlrpclib
 from base64 import standard_b64encode
 
 import lazylibrarian
@@ -14,12 +14,16 @@
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
 import datetime
+import io
 import os
 import platform
+import re
 import shutil
 import tarfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import traceback
 
 import lazylibrarian
@@ -29,25 +33,124 @@ except ImportError:
     import lib.zipfile as zipfile
 from lazylibrarian import database, logger, utorrent, transmission, qbittorrent, \
     deluge, rtorrent, synology, sabnzbd, nzbget
-from lazylibrarian.bookwork import audioRename, seriesInfo
+from lazylibrarian.bookwork import audioRename, seriesInfo_all
 from lazylibrarian.cache import cache_img
 from lazylibrarian.calibre import calibredb
 from lazylibrarian.common import scheduleJob, book_file, opf_file, setperm, bts_file, jpg_file
 from lazylibrarian.formatter import unaccented_str, unaccented, plural, now, today, is_valid_booktype, \
-    replace_all, getList, surnameFirst, makeUnicode, makeBytestr
+    getList, surnameFirst, makeUnicode
 from lazylibrarian.gr import GoodReads
 from lazylibrarian.importer import addAuthorToDB, addAuthorNameToDB, update_totals
 from lazylibrarian.librarysync import get_book_info, find_book_in_db, LibraryScan
 from lazylibrarian.magazinescan import create_id, create_cover
 from lazylibrarian.notifiers import notify_download, custom_notify_download
 from lib.deluge_client import DelugeRPCClient
-from lib.fuzzywuzzy import fuzz
-from lib.six import PY2
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    from lib.fuzzywuzzy import fuzz
 
 # Need to remove characters we don't want in the filename BEFORE adding to EBOOK_DIR
 # as windows drive identifiers have colon, eg c:  but no colons allowed elsewhere?
-__dic__ = {'<': '', '>': '', '...': '', ' & ': ' ', ' = ': ' ', '?': '', '$': 's',
-           ' + ': ' ', '"': '', ',': '', '*': '', ':': '', ';': '', '\'': '', '//': '/', '\\\\': '\\'}
+# single characters go through one C-level translate pass, the multi-character
+# replacements through one compiled regex, instead of sixteen str.replace scans
+_name_trans = str.maketrans({'<': '', '>': '', '?': '', '$': 's', '"': '', ',': '',
+                             '*': '', ':': '', ';': '', '\'': ''})
+_name_repl = {'...': '', ' & ': ' ', ' = ': ' ', ' + ': ' ', '//': '/', '\\\\': '\\'}
+_name_multi = re.compile(r'\.\.\.| & | = | \+ |//|\\\\')
+_tmpl_multi = re.compile(r'\$(Author|Title|Series|SerName|SerNum|\$)')
+_mag_tmpl = re.compile(r'\$(IssueDate|Title)')
+# the LL.(bookid) marker we append to download names
+_ll_id = re.compile(r'LL\.\(([^)]+)\)')
+# characters calibre dislikes in opf files, replaced in one pass
+_opf_repl = {'...': '', ' & ': ' ', ' = ': ' ', '$': 's', ' + ': ' ', '*': ''}
+_opf_multi = re.compile(r'\.\.\.| & | = | \+ |[$*]')
+
+
+def _opf_scrub(match):
+    return _opf_repl[match.group(0)]
+# opf skeleton and optional fragments, filled in by processOPF
+_opf_header = '''<?xml version="1.0"  encoding="UTF-8"?>
+<package version="2.0" xmlns="http://www.idpf.org/2007/opf" >
+    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">
+        <dc:title>%(title)s</dc:title>
+        <dc:creator opf:file-as="%(fileas)s" opf:role="aut">%(author)s</dc:creator>
+        <dc:language>%(lang)s</dc:language>
+        <dc:identifier scheme="%(scheme)s">%(bookid)s</dc:identifier>
+'''
+_opf_isbn = '        <dc:identifier scheme="ISBN">%s</dc:identifier>\n'
+_opf_pub = '        <dc:publisher>%s</dc:publisher>\n'
+_opf_date = '        <dc:date>%s</dc:date>\n'
+_opf_desc = '        <dc:description>%s</dc:description>\n'
+_opf_series = '        <meta content="%s" name="calibre:series"/>\n'
+_opf_index = '        <meta content="%s" name="calibre:series_index"/>\n'
+_opf_guide = '''        <guide>
+            <reference href="%s.jpg" type="cover" title="Cover"/>
+        </guide>
+    </metadata>
+</package>'''
+# markers for the first part of a multi-part audiobook, most specific first
+_part_tokens = (' 001.', ' 01.', ' 1.', ' 001 ', ' 01 ', ' 1 ', '01')
+# failed downloads and incomplete torrent/btsync/usenet files we never process
+_skip_exts = frozenset(['.fail', '.part', '.bts', '.!ut', '.torrent', '.magnet', '.nzb', '.unpack'])
+# download directory mtimes as of the last completed sweep, so an idle
+# postprocessor doesn't rescan directories nothing has touched
+_last_pp_mtimes = {}
+
+
+def sanitize_name(name):
+    """ Strip characters we don't want in a file or directory name """
+    return _name_multi.sub(lambda m: _name_repl[m.group()], name.translate(_name_trans))
+
+
+@lru_cache(maxsize=1024)
+def _series_info(bookid):
+    # one book can be looked at more than once in a sweep (match loop,
+    # then LL.(id) import); cleared at the start of each sweep so edits
+    # to series data still show up
+    return seriesInfo_all(bookid)
+
+
+@lru_cache(maxsize=1024)
+def _mag_foldername(title):
+    # pure function of the title, and the same magazine shows up once
+    # per issue in a sweep so remember the cleaned result
+    return unaccented_str(sanitize_name(title))
+
+
+@lru_cache(maxsize=2048)
+def _iss_id(title, issuedate):
+    # sha1 of the same title/issue pair, reprocessing a snatched issue
+    # shouldn't hash it again
+    return create_id("%s %s" % (title, issuedate))
+
+
+def _parse_nzbdate(nzbdate):
+    """ seconds-since-epoch for our fixed '%Y-%m-%d %H:%M:%S' date strings,
+        skipping strptime's format parsing and locale machinery """
+    return time.mktime((int(nzbdate[0:4]), int(nzbdate[5:7]), int(nzbdate[8:10]),
+                        int(nzbdate[11:13]), int(nzbdate[14:16]), int(nzbdate[17:19]),
+                        0, 0, -1))
+
+
+def _issue_key(issue):
+    """ Sort key for magazine issues, which are either a bare issue
+        number or a date string such as 2015-01-01. Numbered issues
+        compare numerically and sort before dated ones """
+    issue = str(issue)
+    if issue.isdigit():
+        return 0, int(issue), ''
+    return 1, 0, issue
+
+
+def _booktype_extensions():
+    # combined set of ebook/audiobook/magazine extensions (lowercase, no dot)
+    # so one hash lookup replaces three is_valid_booktype calls per file.
+    # Built per caller, not at import, as the types are user config
+    exts = set(getList(lazylibrarian.CONFIG['EBOOK_TYPE']))
+    exts.update(getList(lazylibrarian.CONFIG['AUDIOBOOK_TYPE']))
+    exts.update(getList(lazylibrarian.CONFIG['MAG_TYPE']))
+    return exts
 
 
 def update_downloads(provider):
@@ -60,7 +163,7 @@ def update_downloads(provider):
         myDB.action('INSERT into downloads (Count, Provider) VALUES  (?, ?)', (1, provider))
 
 
-def processAlternate(source_dir=None):
+def processAlternate(source_dir=None, myDB=None):
     # import a book from an alternate directory
     # noinspection PyBroadException
     try:
@@ -71,14 +174,16 @@ def processAlternate(source_dir=None):
             logger.warn('Alternate directory must not be the same as Destination')
             return False
 
+        # share one database connection across the recursion
+        if myDB is None:
+            myDB = database.DBConnection()
         logger.debug('Processing alternate directory %s' % source_dir)
         # first, recursively process any books in subdirectories
-        flist = os.listdir(makeBytestr(source_dir))
-        flist = [makeUnicode(item) for item in flist]
-        for fname in flist:
-            subdir = os.path.join(source_dir, fname)
-            if os.path.isdir(subdir):
-                processAlternate(subdir)
+        # scandir caches the dirent type so no extra stat per entry,
+        # snapshot the list as the importer may delete as it goes
+        for entry in list(os.scandir(source_dir)):
+            if entry.is_dir(follow_symlinks=False):
+                processAlternate(entry.path, myDB)
         # only import one book from each alternate (sub)directory, this is because
         # the importer may delete the directory after importing a book,
         # depending on lazylibrarian.CONFIG['DESTINATION_COPY'] setting
@@ -108,7 +213,6 @@ def processAlternate(source_dir=None):
             if 'title' in metadata and 'creator' in metadata:
                 authorname = metadata['creator']
                 bookname = metadata['title']
-                myDB = database.DBConnection()
                 authorid = ''
                 authmatch = myDB.match('SELECT * FROM authors where AuthorName=?', (authorname,))
 
@@ -156,26 +260,175 @@ def move_into_subdir(sourcedir, targetdir, fname, move='move'):
     # move the book and any related files too, other book formats, or opf, jpg with same title
     # (files begin with fname) from sourcedir to new targetdir
     # can't move metadata.opf or cover.jpg or similar as can't be sure they are ours
-    list_dir = os.listdir(makeBytestr(sourcedir))
-    list_dir = [makeUnicode(item) for item in list_dir]
-    for ourfile in list_dir:
-        if int(lazylibrarian.LOGLEVEL) > 2:
+    verbose = lazylibrarian.LOGLEVEL > 2
+    dest_copy = lazylibrarian.CONFIG['DESTINATION_COPY']
+    moved = []
+    valid_exts = _booktype_extensions()
+    for entry in list(os.scandir(sourcedir)):
+        ourfile = entry.name
+        if verbose:
             logger.debug("Checking %s for %s" % (ourfile, fname))
+        extn = os.path.splitext(ourfile)[1].lstrip('.').lower()
         if ourfile.startswith(fname) or is_valid_booktype(ourfile, booktype="audiobook"):
-            if is_valid_booktype(ourfile, booktype="book") \
-                    or is_valid_booktype(ourfile, booktype="audiobook") \
-                    or is_valid_booktype(ourfile, booktype="mag") \
-                    or os.path.splitext(ourfile)[1].lower() in ['.opf', '.jpg']:
+            if extn in valid_exts or extn in ['opf', 'jpg']:
                 try:
-                    if lazylibrarian.CONFIG['DESTINATION_COPY'] or move == 'copy':
-                        shutil.copyfile(os.path.join(sourcedir, ourfile), os.path.join(targetdir, ourfile))
-                        setperm(os.path.join(targetdir, ourfile))
+                    # copy2/move use the sendfile fast path where the
+                    # kernel supports it, unlike copyfile
+                    if dest_copy or move == 'copy':
+                        shutil.copy2(entry.path, os.path.join(targetdir, ourfile))
                     else:
-                        shutil.move(os.path.join(sourcedir, ourfile), os.path.join(targetdir, ourfile))
-                        setperm(os.path.join(targetdir, ourfile))
+                        # target is a subdir of the source so normally the
+                        # same filesystem, a rename beats copy and delete
+                        try:
+                            os.replace(entry.path, os.path.join(targetdir, ourfile))
+                        except OSError:
+                            shutil.move(entry.path, os.path.join(targetdir, ourfile))
+                    moved.append(os.path.join(targetdir, ourfile))
                 except Exception as why:
                     logger.debug("Failed to copy/move file %s to [%s], %s %s" %
                                  (ourfile, targetdir, type(why).__name__, str(why)))
+    for ourfile in moved:
+        setperm(ourfile)
+
+
+def _fast_rmtree(path):
+    """ Remove a directory tree. scandir's cached entry types save the
+        per-entry stat that shutil.rmtree does before each delete """
+    for entry in list(os.scandir(path)):
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_copy(src, dst):
+    """ Copy file contents in-kernel with copy_file_range or sendfile
+        where the platform has them, instead of shutil's userspace
+        read/write chunks; falls back to shutil.copyfile. Like copyfile
+        this copies data only, not permissions """
+    if hasattr(os, 'copy_file_range') or hasattr(os, 'sendfile'):
+        try:
+            with open(src, 'rb') as fsrc:
+                with open(dst, 'wb') as fdst:
+                    in_fd = fsrc.fileno()
+                    out_fd = fdst.fileno()
+                    remaining = os.fstat(in_fd).st_size
+                    offset = 0
+                    while remaining > 0:
+                        if hasattr(os, 'copy_file_range'):
+                            sent = os.copy_file_range(in_fd, out_fd, remaining)
+                        else:
+                            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                            offset += sent
+                        if not sent:
+                            break
+                        remaining -= sent
+                    if not remaining:
+                        return dst
+        except (EnvironmentError, ValueError):
+            pass  # eg sendfile on a non-regular file, retry the slow way
+    return shutil.copyfile(src, dst)
+
+
+def _setperm_dir(path):
+    """ setperm for every entry of a directory in one scandir pass, using
+        the cached entry type and mode to skip the per-name stat calls and
+        any chmod that wouldn't change anything """
+    value = lazylibrarian.CONFIG['FILE_PERM']
+    if value and value.startswith('0o') and len(value) == 5:
+        file_perm = int(value, 8)
+    else:
+        file_perm = 0o644
+    value = lazylibrarian.CONFIG['DIR_PERM']
+    if value and value.startswith('0o') and len(value) == 5:
+        dir_perm = int(value, 8)
+    else:
+        dir_perm = 0o755
+    failed = 0
+    for entry in os.scandir(path):
+        perm = dir_perm if entry.is_dir(follow_symlinks=False) else file_perm
+        try:
+            if entry.stat(follow_symlinks=False).st_mode & 0o777 != perm:
+                os.chmod(entry.path, perm)
+        except OSError:
+            failed += 1
+    if failed and int(lazylibrarian.LOGLEVEL) > 2:
+        logger.debug("Failed to set permission on %s entries in %s" % (failed, path))
+
+
+def _fast_move(src, dst):
+    """ Rename when source and target are on the same filesystem, which
+        moves no data at all; fall back to shutil.move across devices """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+def _unpack_dir(download_dir, title):
+    """ Create the .unpack target directory, returns its path or '' """
+    targetdir = os.path.join(download_dir, title + '.unpack')
+    try:
+        os.makedirs(targetdir, exist_ok=True)
+        setperm(targetdir)
+    except OSError as why:
+        logger.debug('Failed to create dir [%s], %s' % (targetdir, why.strerror))
+        return ''
+    return targetdir
+
+
+def _zip_opener(pp_path):
+    """ Returns a factory producing ZipFile handles for pp_path. Where the
+        archive fits comfortably in memory it is read once and the bytes
+        shared, each handle wrapping its own BytesIO view, so concurrent
+        extraction workers don't each hold a copy. Falls back to handles
+        on the plain file """
+    try:
+        if os.path.getsize(pp_path) < 256 * 1024 * 1024:
+            with open(pp_path, 'rb') as f:
+                data = f.read()
+            return lambda: zipfile.ZipFile(io.BytesIO(data))
+    except EnvironmentError:
+        pass
+    return lambda: zipfile.ZipFile(pp_path)
+
+
+def _tar_opener(pp_path):
+    """ Factory for TarFile handles. r:* transparently handles
+        tar.gz/bz2/xz, plain TarFile doesn't """
+    return lambda: tarfile.open(pp_path, mode='r:*')
+
+
+def _close_archive(z):
+    # the unrar RarFile has no close method
+    close = getattr(z, 'close', None)
+    if close:
+        close()
+
+
+def _extract_entries(open_archive, items, targetdir):
+    """ Extract the chosen archive entries into targetdir. Multi-entry
+        archives (audiobook bundles) extract concurrently; the readers
+        aren't thread-safe so each worker opens its own handle """
+    def extract_one(item):
+        logger.debug('Extracting %s to %s' % (item, targetdir))
+        z = open_archive()
+        try:
+            if hasattr(z, 'extractfile'):  # tarfile has no open()
+                src = z.extractfile(item)
+            else:
+                src = z.open(item)
+            with open(os.path.join(targetdir, item), 'wb') as f:
+                shutil.copyfileobj(src, f, 131072)
+        finally:
+            _close_archive(z)
+
+    if len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(items), 4)) as pool:
+            list(pool.map(extract_one, items))
+    else:
+        extract_one(items[0])
 
 
 def unpack_archive(pp_path, download_dir, title):
@@ -189,99 +442,97 @@ def unpack_archive(pp_path, download_dir, title):
         gotrar = False
         rarfile = None
 
-    targetdir = ''
+    verbose = lazylibrarian.LOGLEVEL > 2
     if not os.path.isfile(pp_path):  # regular files only
-        targetdir = ''
-    elif zipfile.is_zipfile(pp_path):
-        if int(lazylibrarian.LOGLEVEL) > 2:
-            logger.debug('%s is a zip file' % pp_path)
-        z = zipfile.ZipFile(pp_path)
-        namelist = z.namelist()
-        for item in namelist:
-            if is_valid_booktype(item, booktype="book") or is_valid_booktype(item, booktype="audiobook") \
-                    or is_valid_booktype(item, booktype="mag"):
-                if not targetdir:
-                    targetdir = os.path.join(download_dir, title + '.unpack')
-                if not os.path.isdir(targetdir):
-                    try:
-                        os.makedirs(targetdir)
-                        setperm(targetdir)
-                    except OSError as why:
-                        if not os.path.isdir(targetdir):
-                            logger.debug('Failed to create dir [%s], %s' % (targetdir, why.strerror))
-                            return ''
-                if PY2:
-                    fmode = 'wb'
-                else:
-                    fmode = 'w'
-                with open(os.path.join(targetdir, item), fmode) as f:
-                    logger.debug('Extracting %s to %s' % (item, targetdir))
-                    f.write(z.read(item))
-            else:
-                logger.debug('Skipping zipped file %s' % item)
-
-    elif tarfile.is_tarfile(pp_path):
-        if int(lazylibrarian.LOGLEVEL) > 2:
-            logger.debug('%s is a tar file' % pp_path)
-        z = tarfile.TarFile(pp_path)
-        namelist = z.getnames()
-        for item in namelist:
-            if is_valid_booktype(item, booktype="book") or is_valid_booktype(item, booktype="audiobook") \
-                    or is_valid_booktype(item, booktype="mag"):
-                if not targetdir:
-                    targetdir = os.path.join(download_dir, title + '.unpack')
-                if not os.path.isdir(targetdir):
-                    try:
-                        os.makedirs(targetdir)
-                        setperm(targetdir)
-                    except OSError as why:
-                        if not os.path.isdir(targetdir):
-                            logger.debug('Failed to create dir [%s], %s' % (targetdir, why.strerror))
-                            return ''
-                if PY2:
-                    fmode = 'wb'
-                else:
-                    fmode = 'w'
-                with open(os.path.join(targetdir, item), fmode) as f:
-                    logger.debug('Extracting %s to %s' % (item, targetdir))
-                    f.write(z.extractfile(item).read())
-            else:
-                logger.debug('Skipping tarred file %s' % item)
-
-    elif gotrar and rarfile.is_rarfile(pp_path):
-        if int(lazylibrarian.LOGLEVEL) > 2:
-            logger.debug('%s is a rar file' % pp_path)
-        z = rarfile.RarFile(pp_path)
-        namelist = z.namelist()
-        for item in namelist:
-            if is_valid_booktype(item, booktype="book") or is_valid_booktype(item, booktype="audiobook") \
-                    or is_valid_booktype(item, booktype="mag"):
-                if not targetdir:
-                    targetdir = os.path.join(download_dir, title + '.unpack')
-                if not os.path.isdir(targetdir):
-                    try:
-                        os.makedirs(targetdir)
-                        setperm(targetdir)
-                    except OSError as why:
-                        if not os.path.isdir(targetdir):
-                            logger.debug('Failed to create dir [%s], %s' % (targetdir, why.strerror))
-                            return ''
-                if PY2:
-                    fmode = 'wb'
-                else:
-                    fmode = 'w'
-                with open(os.path.join(targetdir, item), fmode) as f:
-                    logger.debug('Extracting %s to %s' % (item, targetdir))
-                    f.write(z.read(item))
-            else:
-                logger.debug('Skipping rarred file %s' % item)
-    else:
+        return ''
+
+    # probe/factory pairs so all archive types share one extraction path;
+    # the factory runs once per archive and returns the per-handle opener
+    openers = [
+        ('zipped', zipfile.is_zipfile, _zip_opener),
+        ('tarred', tarfile.is_tarfile, _tar_opener),
+    ]
+    if gotrar:
+        openers.append(('rarred', rarfile.is_rarfile, lambda path: (lambda: rarfile.RarFile(path))))
+
+    archive_type = ''
+    open_archive = None
+    namelist = []
+    for kind, probe, factory in openers:
+        if probe(pp_path):
+            if verbose:
+                logger.debug('%s is a %s file' % (pp_path, kind))
+            archive_type = kind
+            open_archive = factory(pp_path)
+            z = open_archive()
+            try:
+                namelist = z.getnames() if hasattr(z, 'getnames') else z.namelist()
+            finally:
+                _close_archive(z)
+            break
+    if not archive_type:
         logger.debug('[%s] Not a recognised archive' % pp_path)
+        return ''
+
+    valid_exts = _booktype_extensions()
+    wanted = [item for item in namelist if os.path.splitext(item)[1].lstrip('.').lower() in valid_exts]
+    if len(wanted) != len(namelist):
+        logger.debug('Skipping %s %s file%s' % (len(namelist) - len(wanted), archive_type,
+                                                plural(len(namelist) - len(wanted))))
+    if not wanted:
+        return ''
+
+    targetdir = _unpack_dir(download_dir, title)
+    if targetdir:
+        _extract_entries(open_archive, wanted, targetdir)
     return targetdir
 
 
+def _downloader_name(book):
+    """ Ask the download client for the current name of a snatched item,
+        returns '' if the client has no answer """
+    try:
+        logger.debug("%s was sent to %s" % (book['NZBtitle'], book['Source']))
+        if book['Source'] == 'TRANSMISSION':
+            return transmission.getTorrentFolder(book['DownloadID'])
+        elif book['Source'] == 'UTORRENT':
+            return utorrent.nameTorrent(book['DownloadID'])
+        elif book['Source'] == 'RTORRENT':
+            return rtorrent.getName(book['DownloadID'])
+        elif book['Source'] == 'QBITTORRENT':
+            return qbittorrent.getName(book['DownloadID'])
+        elif book['Source'] == 'SYNOLOGY_TOR':
+            return synology.getName(book['DownloadID'])
+        elif book['Source'] == 'DELUGEWEBUI':
+            return deluge.getTorrentFolder(book['DownloadID'])
+    except Exception as e:
+        logger.debug("Failed to get updated torrent name from %s for %s: %s %s" %
+                     (book['Source'], book['DownloadID'], type(e).__name__, str(e)))
+    return ''
+
+
+def _delugerpc_names():
+    """ Get the names of all torrents in the Deluge daemon with one bulk
+        status call, so we don't pay a round-trip per snatched item """
+    names = {}
+    client = DelugeRPCClient(lazylibrarian.CONFIG['DELUGE_HOST'],
+                             lazylibrarian.CONFIG['DELUGE_URL_BASE'],
+                             int(lazylibrarian.CONFIG['DELUGE_PORT']),
+                             lazylibrarian.CONFIG['DELUGE_USER'],
+                             lazylibrarian.CONFIG['DELUGE_PASS'])
+    try:
+        client.connect()
+        result = client.call('core.get_torrents_status', {}, ['name'])
+        for tor_id, status in result.items():
+            if 'name' in status:
+                names[makeUnicode(tor_id)] = unaccented_str(makeUnicode(status['name']))
+    except Exception as e:
+        logger.debug('DelugeRPC failed %s %s' % (type(e).__name__, str(e)))
+    return names
+
+
 def cron_processDir():
-    if 'POSTPROCESS' not in [n.name for n in [t for t in threading.enumerate()]]:
+    if not any(t.name == 'POSTPROCESS' for t in threading.enumerate()):
         processDir()
 
 
@@ -292,9 +543,26 @@ def processDir(reset=False):
         if "Thread-" in threadname:
             threading.currentThread().name = "POSTPROCESS"
         ppcount = 0
+        _series_info.cache_clear()
         myDB = database.DBConnection()
-        skipped_extensions = ['.fail', '.part', '.bts', '.!ut', '.torrent', '.magnet', '.nzb', '.unpack']
-
+        # hoist config/loglevel lookups out of the per-file loops
+        verbose = lazylibrarian.LOGLEVEL > 2
+        dload_ratio = lazylibrarian.CONFIG['DLOAD_RATIO']
+        dest_copy = lazylibrarian.CONFIG['DESTINATION_COPY']
+        keep_seeding = lazylibrarian.CONFIG['KEEP_SEEDING']
+        if 'windows' in platform.system().lower() and '/' in lazylibrarian.CONFIG['EBOOK_DEST_FOLDER']:
+            logger.warn('Please check your EBOOK_DEST_FOLDER setting')
+            lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'] = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'].replace('/', '\\')
+        ebook_template = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER']
+        ebook_dest_file = lazylibrarian.CONFIG['EBOOK_DEST_FILE']
+        mag_dest_folder = lazylibrarian.CONFIG['MAG_DEST_FOLDER']
+        mag_dest_file = lazylibrarian.CONFIG['MAG_DEST_FILE']
+        mag_relative = lazylibrarian.CONFIG['MAG_RELATIVE']
+        autoadd_mag = lazylibrarian.CONFIG['IMP_AUTOADDMAG']
+        task_age = lazylibrarian.CONFIG['TASK_AGE']
+        extras_pool = None  # deferred magazine cover/opf generation
+        extra_jobs = []
+        valid_exts = _booktype_extensions()
         templist = getList(lazylibrarian.CONFIG['DOWNLOAD_DIR'], ',')
         if len(templist) and lazylibrarian.DIRECTORY("Download") != templist[0]:
             templist.insert(0, lazylibrarian.DIRECTORY("Download"))
@@ -303,56 +571,61 @@ def processDir(reset=False):
             if os.path.isdir(item):
                 dirlist.append(item)
         for download_dir in dirlist:
+            # join in author/title up front rather than querying per match.
+            # For magazines BookID holds the title so those get NULLs here
+            cmd = 'SELECT wanted.*,AuthorName,BookName from wanted'
+            cmd += ' LEFT JOIN books ON books.BookID = wanted.BookID'
+            cmd += ' LEFT JOIN authors ON authors.AuthorID = books.AuthorID'
+            cmd += ' WHERE wanted.Status="Snatched"'
+            snatched = myDB.select(cmd)
+            logger.debug('Found %s file%s marked "Snatched"' % (len(snatched), plural(len(snatched))))
+
             try:
-                downloads = os.listdir(makeBytestr(download_dir))
-                downloads = [makeUnicode(item) for item in downloads]
+                dir_mtime = os.stat(download_dir).st_mtime
+            except OSError:
+                dir_mtime = 0
+            if not reset and not snatched and dir_mtime and _last_pp_mtimes.get(download_dir) == dir_mtime:
+                # nothing waiting and nothing has been added or removed
+                # since last sweep, no point walking the directory
+                logger.debug('Skipping unchanged directory %s' % download_dir)
+                continue
+
+            try:
+                downloads = [entry.name for entry in os.scandir(download_dir)]
             except OSError as why:
                 logger.error('Could not access directory [%s] %s' % (download_dir, why.strerror))
                 threading.currentThread().name = "WEBSERVER"
                 return
 
-            snatched = myDB.select('SELECT * from wanted WHERE Status="Snatched"')
-            logger.debug('Found %s file%s marked "Snatched"' % (len(snatched), plural(len(snatched))))
             logger.debug('Checking %s file%s in %s' % (len(downloads), plural(len(downloads)), download_dir))
 
             if len(snatched) > 0 and len(downloads) > 0:
+                # the deluge daemon can list every torrent in one call, the
+                # other clients only expose per-id lookups
+                sources = set([book['Source'] for book in snatched])
+                delugerpc_names = _delugerpc_names() if 'DELUGERPC' in sources else {}
+                # each name lookup is an independent network round-trip,
+                # so overlap them rather than paying for them one by one.
+                # The book processing itself stays serial: books can match
+                # the same download and magazine issues must apply in order
+                lookups = [book for book in snatched if book['Source'] in
+                           ('TRANSMISSION', 'UTORRENT', 'RTORRENT', 'QBITTORRENT',
+                            'SYNOLOGY_TOR', 'DELUGEWEBUI')]
+                torrent_names = {}
+                if len(lookups) > 1:
+                    with ThreadPoolExecutor(max_workers=min(len(lookups), 4)) as pool:
+                        for entry, name in zip(lookups, pool.map(_downloader_name, lookups)):
+                            torrent_names[entry['NZBurl']] = name
+                elif lookups:
+                    torrent_names[lookups[0]['NZBurl']] = _downloader_name(lookups[0])
                 for book in snatched:
                     # if torrent, see if we can get current status from the downloader as the name
                     # may have been changed once magnet resolved, or download started or completed
                     # depending on torrent downloader. Usenet doesn't change the name. We like usenet.
-                    torrentname = ''
-                    try:
-                        logger.debug("%s was sent to %s" % (book['NZBtitle'], book['Source']))
-                        if book['Source'] == 'TRANSMISSION':
-                            torrentname = transmission.getTorrentFolder(book['DownloadID'])
-                        elif book['Source'] == 'UTORRENT':
-                            torrentname = utorrent.nameTorrent(book['DownloadID'])
-                        elif book['Source'] == 'RTORRENT':
-                            torrentname = rtorrent.getName(book['DownloadID'])
-                        elif book['Source'] == 'QBITTORRENT':
-                            torrentname = qbittorrent.getName(book['DownloadID'])
-                        elif book['Source'] == 'SYNOLOGY_TOR':
-                            torrentname = synology.getName(book['DownloadID'])
-                        elif book['Source'] == 'DELUGEWEBUI':
-                            torrentname = deluge.getTorrentFolder(book['DownloadID'])
-                        elif book['Source'] == 'DELUGERPC':
-                            client = DelugeRPCClient(lazylibrarian.CONFIG['DELUGE_HOST'],
-                                                     lazylibrarian.CONFIG['DELUGE_URL_BASE'],
-                                                     int(lazylibrarian.CONFIG['DELUGE_PORT']),
-                                                     lazylibrarian.CONFIG['DELUGE_USER'],
-                                                     lazylibrarian.CONFIG['DELUGE_PASS'])
-                            try:
-                                client.connect()
-                                result = client.call('core.get_torrent_status', book['DownloadID'], {})
-                                #    for item in result:
-                                #        logger.debug ('Deluge RPC result %s: %s' % (item, result[item]))
-                                if 'name' in result:
-                                    torrentname = unaccented_str(result['name'])
-                            except Exception as e:
-                                logger.debug('DelugeRPC failed %s %s' % (type(e).__name__, str(e)))
-                    except Exception as e:
-                        logger.debug("Failed to get updated torrent name from %s for %s: %s %s" %
-                                     (book['Source'], book['DownloadID'], type(e).__name__, str(e)))
+                    if book['Source'] == 'DELUGERPC':
+                        torrentname = delugerpc_names.get(book['DownloadID'], '')
+                    else:
+                        torrentname = torrent_names.get(book['NZBurl'], '')
 
                     matchtitle = unaccented_str(book['NZBtitle'])
                     if torrentname and torrentname != matchtitle:
@@ -374,111 +647,120 @@ def processDir(reset=False):
                             book_type = 'Magazine'
 
                     logger.debug('Looking for %s %s in %s' % (book_type, matchtitle, download_dir))
+                    candidates = []
+                    best_reject = None
                     for fname in downloads:
                         # skip if failed before or incomplete torrents, or incomplete btsync etc
-                        if int(lazylibrarian.LOGLEVEL) > 2:
+                        if verbose:
                             logger.debug("Checking extn on %s" % fname)
                         extn = os.path.splitext(fname)[1]
-                        if not extn or extn not in skipped_extensions:
-                            # This is to get round differences in torrent filenames.
-                            # Usenet is ok, but Torrents aren't always returned with the name we searched for
-                            # We ask the torrent downloader for the torrent name, but don't always get an answer
-                            # so we try to do a "best match" on the name, there might be a better way...
-
-                            matchname = fname
-                            # torrents might have words_separated_by_underscores
-                            matchname = matchname.split(' LL.(')[0].replace('_', ' ')
-                            matchtitle = matchtitle.split(' LL.(')[0].replace('_', ' ')
-                            match = fuzz.token_set_ratio(matchtitle, matchname)
-                            if int(lazylibrarian.LOGLEVEL) > 2:
-                                logger.debug("%s%% match %s : %s" % (match, matchtitle, matchname))
-                            if match >= lazylibrarian.CONFIG['DLOAD_RATIO']:
-                                pp_path = os.path.join(download_dir, fname)
-
-                                if int(lazylibrarian.LOGLEVEL) > 2:
-                                    logger.debug("processDir %s %s" % (type(pp_path), repr(pp_path)))
-
-                                if os.path.isfile(pp_path):
-                                    # Check for single file downloads first. Book/mag file in download root.
-                                    # move the file into it's own subdirectory so we don't move/delete
-                                    # things that aren't ours
-                                    # note that epub are zipfiles so check booktype first
-                                    #
-                                    if is_valid_booktype(fname, booktype="book") \
-                                            or is_valid_booktype(fname, booktype="audiobook") \
-                                            or is_valid_booktype(fname, booktype="mag"):
-                                        if int(lazylibrarian.LOGLEVEL) > 2:
-                                            logger.debug('file [%s] is a valid book/mag' % fname)
-                                        if bts_file(download_dir):
-                                            logger.debug("Skipping %s, found a .bts file" % download_dir)
-                                        else:
-                                            aname = os.path.splitext(fname)[0]
-                                            while aname[-1] in '. ':
-                                                aname = aname[:-1]
-                                            targetdir = os.path.join(download_dir, aname)
-                                            if not os.path.isdir(targetdir):
-                                                try:
-                                                    os.makedirs(targetdir)
-                                                    setperm(targetdir)
-                                                except OSError as why:
-                                                    if not os.path.isdir(targetdir):
-                                                        logger.debug('Failed to create directory [%s], %s' %
-                                                                     (targetdir, why.strerror))
-                                            if os.path.isdir(targetdir):
-                                                if book['NZBmode'] in ['torrent', 'magnet', 'torznab'] and \
-                                                        lazylibrarian.CONFIG['KEEP_SEEDING']:
-                                                    move_into_subdir(download_dir, targetdir, fname, move='copy')
-                                                else:
-                                                    move_into_subdir(download_dir, targetdir, fname)
-                                                pp_path = targetdir
-                                    else:
-                                        # Is file an archive, if so look inside and extract to new dir
-                                        res = unpack_archive(pp_path, download_dir, matchtitle)
-                                        if res:
-                                            pp_path = res
-                                        else:
-                                            logger.debug('Skipping unhandled file %s' % fname)
-
-                                elif os.path.isdir(pp_path):
-                                    logger.debug('Found folder (%s%%) [%s] for %s %s' %
-                                                 (match, pp_path, book_type, matchtitle))
-
-                                    for f in os.listdir(makeBytestr(pp_path)):
-                                        f = makeUnicode(f)
-                                        if not is_valid_booktype(f, 'book') \
-                                                and not is_valid_booktype(f, 'audiobook') \
-                                                and not is_valid_booktype(f, 'mag'):
-                                            # Is file an archive, if so look inside and extract to new dir
-                                            res = unpack_archive(os.path.join(pp_path, f), pp_path, matchtitle)
-                                            if res:
-                                                pp_path = res
-                                                break
-
-                                    skipped = False
-                                    if book_type == 'eBook' and not book_file(pp_path, 'ebook'):
-                                        logger.debug("Skipping %s, no ebook found" % pp_path)
-                                        skipped = True
-                                    elif book_type == 'AudioBook' and not book_file(pp_path, 'audiobook'):
-                                        logger.debug("Skipping %s, no audiobook found" % pp_path)
-                                        skipped = True
-                                    elif book_type == 'Magazine' and not book_file(pp_path, 'mag'):
-                                        logger.debug("Skipping %s, no magazine found" % pp_path)
-                                        skipped = True
-                                    if not os.listdir(makeBytestr(pp_path)):
-                                        logger.debug("Skipping %s, folder is empty" % pp_path)
-                                        skipped = True
-                                    elif bts_file(pp_path):
-                                        logger.debug("Skipping %s, found a .bts file" % pp_path)
-                                        skipped = True
-                                    if not skipped:
-                                        matches.append([match, pp_path, book])
+                        if extn and extn.lower() in _skip_exts:
+                            logger.debug('Skipping %s' % fname)
+                            continue
+                        # This is to get round differences in torrent filenames.
+                        # Usenet is ok, but Torrents aren't always returned with the name we searched for
+                        # We ask the torrent downloader for the torrent name, but don't always get an answer
+                        # so we try to do a "best match" on the name, there might be a better way...
+
+                        matchname = fname
+                        # torrents might have words_separated_by_underscores
+                        matchname = matchname.split(' LL.(')[0].replace('_', ' ')
+                        matchtitle = matchtitle.split(' LL.(')[0].replace('_', ' ')
+                        match = fuzz.token_set_ratio(matchtitle, matchname)
+                        if verbose:
+                            logger.debug("%s%% match %s : %s" % (match, matchtitle, matchname))
+                        if match >= dload_ratio:
+                            if match >= 95:
+                                # near-certain match, no point scoring the rest
+                                candidates = [(match, fname)]
+                                break
+                            candidates.append((match, fname))
+                        elif best_reject is None or match > best_reject[0]:
+                            # remember the nearest miss so we can report it
+                            best_reject = (match, os.path.join(download_dir, fname))
+
+                    # inspect candidates best score first and stop at the first
+                    # usable one, so the also-rans never pay for archive
+                    # extraction and file moves
+                    candidates.sort(key=lambda x: x[0], reverse=True)
+                    for match, fname in candidates:
+                        pp_path = os.path.join(download_dir, fname)
+
+                        if verbose:
+                            logger.debug("processDir %s %s" % (type(pp_path), repr(pp_path)))
+
+                        if os.path.isfile(pp_path):
+                            # Check for single file downloads first. Book/mag file in download root.
+                            # move the file into it's own subdirectory so we don't move/delete
+                            # things that aren't ours
+                            # note that epub are zipfiles so check booktype first
+                            #
+                            if os.path.splitext(fname)[1].lstrip('.').lower() in valid_exts:
+                                if verbose:
+                                    logger.debug('file [%s] is a valid book/mag' % fname)
+                                if bts_file(download_dir):
+                                    logger.debug("Skipping %s, found a .bts file" % download_dir)
                                 else:
-                                    logger.debug('%s is not a file or a directory?' % pp_path)
+                                    aname = os.path.splitext(fname)[0].rstrip('. ')
+                                    targetdir = os.path.join(download_dir, aname)
+                                    try:
+                                        os.makedirs(targetdir, exist_ok=True)
+                                        setperm(targetdir)
+                                    except OSError as why:
+                                        logger.debug('Failed to create directory [%s], %s' %
+                                                     (targetdir, why.strerror))
+                                    if os.path.isdir(targetdir):
+                                        if book['NZBmode'] in ['torrent', 'magnet', 'torznab'] and \
+                                                keep_seeding:
+                                            move_into_subdir(download_dir, targetdir, fname, move='copy')
+                                        else:
+                                            move_into_subdir(download_dir, targetdir, fname)
+                                        pp_path = targetdir
                             else:
-                                pp_path = os.path.join(download_dir, fname)
-                                matches.append([match, pp_path, book])  # so we can report closest match
+                                # Is file an archive, if so look inside and extract to new dir
+                                res = unpack_archive(pp_path, download_dir, matchtitle)
+                                if res:
+                                    pp_path = res
+                                else:
+                                    logger.debug('Skipping unhandled file %s' % fname)
+
+                        elif os.path.isdir(pp_path):
+                            logger.debug('Found folder (%s%%) [%s] for %s %s' %
+                                         (match, pp_path, book_type, matchtitle))
+
+                            for f in list(os.scandir(pp_path)):
+                                if os.path.splitext(f.name)[1].lstrip('.').lower() not in valid_exts:
+                                    # Is file an archive, if so look inside and extract to new dir
+                                    res = unpack_archive(f.path, pp_path, matchtitle)
+                                    if res:
+                                        pp_path = res
+                                        break
+
+                            skipped = False
+                            if book_type == 'eBook' and not book_file(pp_path, 'ebook'):
+                                logger.debug("Skipping %s, no ebook found" % pp_path)
+                                skipped = True
+                            elif book_type == 'AudioBook' and not book_file(pp_path, 'audiobook'):
+                                logger.debug("Skipping %s, no audiobook found" % pp_path)
+                                skipped = True
+                            elif book_type == 'Magazine' and not book_file(pp_path, 'mag'):
+                                logger.debug("Skipping %s, no magazine found" % pp_path)
+                                skipped = True
+                            if next(os.scandir(pp_path), None) is None:
+                                logger.debug("Skipping %s, folder is empty" % pp_path)
+                                skipped = True
+                            elif bts_file(pp_path):
+                                logger.debug("Skipping %s, found a .bts file" % pp_path)
+                                skipped = True
+                            if not skipped:
+                                matches.append([match, pp_path, book])
+                                break
                         else:
-                            logger.debug('Skipping %s' % fname)
+                            logger.debug('%s is not a file or a directory?' % pp_path)
+
+                    if not matches and best_reject:
+                        # so we can report closest match
+                        matches.append([best_reject[0], best_reject[1], book])
 
                     match = 0
                     if matches:
@@ -486,45 +768,36 @@ def processDir(reset=False):
                         match = highest[0]
                         pp_path = highest[1]
                         book = highest[2]
-                    if match and match >= lazylibrarian.CONFIG['DLOAD_RATIO']:
+                    if match and match >= dload_ratio:
                         mostrecentissue = ''
                         logger.debug('Found match (%s%%): %s for %s %s' % (match, pp_path, book_type, book['NZBtitle']))
 
-                        cmd = 'SELECT AuthorName,BookName from books,authors WHERE BookID=?'
-                        cmd += ' and books.AuthorID = authors.AuthorID'
-                        data = myDB.match(cmd, (book['BookID'],))
-                        if data:  # it's ebook/audiobook
+                        if book['BookName'] and book['AuthorName']:  # it's ebook/audiobook
                             logger.debug('Processing %s %s' % (book_type, book['BookID']))
-                            authorname = data['AuthorName']
+                            authorname = book['AuthorName']
                             authorname = ' '.join(authorname.split())  # ensure no extra whitespace
-                            bookname = data['BookName']
-                            if 'windows' in platform.system().lower() and '/' in \
-                                    lazylibrarian.CONFIG['EBOOK_DEST_FOLDER']:
-                                logger.warn('Please check your EBOOK_DEST_FOLDER setting')
-                                lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'] = lazylibrarian.CONFIG[
-                                    'EBOOK_DEST_FOLDER'].replace('/', '\\')
+                            bookname = book['BookName']
                             # Default destination path, should be allowed change per config file.
-                            dest_path = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'].replace(
-                                '$Author', authorname).replace(
-                                '$Title', bookname).replace(
-                                '$Series', seriesInfo(book['BookID'])).replace(
-                                '$SerName', seriesInfo(book['BookID'], 'Name')).replace(
-                                '$SerNum', seriesInfo(book['BookID'], 'Num')).replace(
-                                '$$', ' ')
+                            template = ebook_template
+                            repl = {'Author': authorname, 'Title': bookname,
+                                    'Series': '', 'SerName': '', 'SerNum': '', '$': ' '}
+                            if '$Ser' in template:
+                                # only hit the series tables when the template asks for them,
+                                # and only once for all three parts
+                                series, sername, sernum = _series_info(book['BookID'])
+                                repl['Series'] = series
+                                repl['SerName'] = sername or series
+                                repl['SerNum'] = sernum or series
+                            dest_path = _tmpl_multi.sub(lambda m: repl[m.group(1)], template)
                             dest_path = ' '.join(dest_path.split()).strip()
-                            dest_path = replace_all(dest_path, __dic__)
+                            dest_path = sanitize_name(dest_path)
                             dest_dir = lazylibrarian.DIRECTORY('eBook')
                             if book_type == 'AudioBook' and lazylibrarian.DIRECTORY('Audio'):
                                 dest_dir = lazylibrarian.DIRECTORY('Audio')
                             dest_path = os.path.join(dest_dir, dest_path)
 
-                            global_name = lazylibrarian.CONFIG['EBOOK_DEST_FILE'].replace(
-                                '$Author', authorname).replace(
-                                '$Title', bookname).replace(
-                                '$Series', '').replace(
-                                '$SerName', '').replace(
-                                '$SerNum', '').replace(
-                                '$$', ' ')
+                            repl.update({'Series': '', 'SerName': '', 'SerNum': ''})
+                            global_name = _tmpl_multi.sub(lambda m: repl[m.group(1)], ebook_dest_file)
                             global_name = ' '.join(global_name.split()).strip()
                         else:
                             data = myDB.match('SELECT IssueDate from magazines WHERE Title=?', (book['BookID'],))
@@ -534,23 +807,20 @@ def processDir(reset=False):
                                 # but if multiple files are downloading, there will be an error in post-processing
                                 # trying to go to the same directory.
                                 mostrecentissue = data['IssueDate']  # keep for processing issues arriving out of order
-                                mag_name = unaccented_str(replace_all(book['BookID'], __dic__))
+                                mag_name = _mag_foldername(book['BookID'])
+                                mag_repl = {'IssueDate': book['AuxInfo'], 'Title': mag_name}
                                 # book auxinfo is a cleaned date, eg 2015-01-01
-                                dest_path = lazylibrarian.CONFIG['MAG_DEST_FOLDER'].replace(
-                                    '$IssueDate', book['AuxInfo']).replace('$Title', mag_name)
+                                dest_path = _mag_tmpl.sub(lambda m: mag_repl[m.group(1)], mag_dest_folder)
 
-                                if lazylibrarian.CONFIG['MAG_RELATIVE']:
+                                if mag_relative:
                                     if dest_path[0] not in '._':
                                         dest_path = '_' + dest_path
                                     dest_dir = lazylibrarian.DIRECTORY('eBook')
                                     dest_path = os.path.join(dest_dir, dest_path)
 
-                                if PY2:
-                                    dest_path = dest_path.encode(lazylibrarian.SYS_ENCODING)
                                 authorname = None
                                 bookname = None
-                                global_name = lazylibrarian.CONFIG['MAG_DEST_FILE'].replace(
-                                    '$IssueDate', book['AuxInfo']).replace('$Title', mag_name)
+                                global_name = _mag_tmpl.sub(lambda m: mag_repl[m.group(1)], mag_dest_file)
                                 global_name = unaccented(global_name)
                             else:  # not recognised, maybe deleted
                                 logger.debug('Nothing in database matching "%s"' % book['BookID'])
@@ -563,7 +833,7 @@ def processDir(reset=False):
                                      (book['NZBmode'], book['NZBtitle']))
                         if match:
                             logger.debug('Closest match (%s%%): %s' % (match, pp_path))
-                            if int(lazylibrarian.LOGLEVEL) > 2:
+                            if verbose:
                                 for match in matches:
                                     logger.debug('Match: %s%%  %s' % (match[0], match[1]))
                         continue
@@ -575,16 +845,16 @@ def processDir(reset=False):
                         # only update the snatched ones in case multiple matches for same book/magazine issue
                         controlValueDict = {"NZBurl": book['NZBurl'], "Status": "Snatched"}
                         newValueDict = {"Status": "Processed", "NZBDate": now()}  # say when we processed it
-                        myDB.upsert("wanted", newValueDict, controlValueDict)
 
                         if bookname:  # it's ebook or audiobook
+                            myDB.upsert("wanted", newValueDict, controlValueDict)
                             processExtras(dest_file, global_name, book['BookID'], book_type)
-                        else:  # update mags
+                        else:  # update mags, deferring the three writes into one flush
+                            batch = myDB.batch()
+                            batch.upsert("wanted", newValueDict, controlValueDict)
                             if mostrecentissue:
-                                if mostrecentissue.isdigit() and str(book['AuxInfo']).isdigit():
-                                    older = (int(mostrecentissue) > int(book['AuxInfo']))  # issuenumber
-                                else:
-                                    older = (mostrecentissue > book['AuxInfo'])  # YYYY-MM-DD
+                                # issuenumber or YYYY-MM-DD
+                                older = _issue_key(mostrecentissue) > _issue_key(book['AuxInfo'])
                             else:
                                 older = False
 
@@ -595,29 +865,40 @@ def processDir(reset=False):
                                 newValueDict = {"IssueDate": book['AuxInfo'], "LastAcquired": today(),
                                                 "LatestCover": os.path.splitext(dest_file)[0] + '.jpg',
                                                 "IssueStatus": "Open"}
-                            myDB.upsert("magazines", newValueDict, controlValueDict)
+                            batch.upsert("magazines", newValueDict, controlValueDict)
 
-                            iss_id = create_id("%s %s" % (book['BookID'], book['AuxInfo']))
+                            iss_id = _iss_id(book['BookID'], book['AuxInfo'])
                             controlValueDict = {"Title": book['BookID'], "IssueDate": book['AuxInfo']}
                             newValueDict = {"IssueAcquired": today(),
                                             "IssueFile": dest_file,
                                             "IssueID": iss_id
                                             }
-                            myDB.upsert("issues", newValueDict, controlValueDict)
-
-                            # create a thumbnail cover for the new issue
-                            create_cover(dest_file)
-                            processMAGOPF(dest_file, book['BookID'], book['AuxInfo'], iss_id)
-                            if lazylibrarian.CONFIG['IMP_AUTOADDMAG']:
+                            batch.upsert("issues", newValueDict, controlValueDict)
+                            batch.flush()
+
+                            # create a thumbnail cover and opf for the new issue
+                            if autoadd_mag:
+                                # autoadd copies the whole issue directory, so the
+                                # cover and opf have to exist before it runs
+                                create_cover(dest_file)
+                                processMAGOPF(dest_file, book['BookID'], book['AuxInfo'], iss_id)
                                 dest_path = os.path.dirname(dest_file)
                                 processAutoAdd(dest_path, booktype='mag')
+                            else:
+                                # image decode/write doesn't need to hold up the
+                                # next download, let a worker get on with it
+                                if extras_pool is None:
+                                    extras_pool = ThreadPoolExecutor(max_workers=2)
+                                extra_jobs.append(extras_pool.submit(create_cover, dest_file))
+                                extra_jobs.append(extras_pool.submit(
+                                    processMAGOPF, dest_file, book['BookID'], book['AuxInfo'], iss_id))
 
                         # calibre or ll copied/moved the files we want, now delete source files
 
                         to_delete = True
                         if book['NZBmode'] in ['torrent', 'magnet', 'torznab']:
                             # Only delete torrents if we don't want to keep seeding
-                            if lazylibrarian.CONFIG['KEEP_SEEDING']:
+                            if keep_seeding:
                                 logger.warn('%s is seeding %s %s' % (book['Source'], book['NZBmode'], book['NZBtitle']))
                                 to_delete = False
 
@@ -636,7 +917,7 @@ def processDir(reset=False):
                         if to_delete:
                             # only delete the files if not in download root dir and DESTINATION_COPY not set
                             # always delete files we unpacked from an archive
-                            if lazylibrarian.CONFIG['DESTINATION_COPY']:
+                            if dest_copy:
                                 to_delete = False
                             if pp_path == download_dir:
                                 to_delete = False
@@ -646,14 +927,14 @@ def processDir(reset=False):
                                 if os.path.isdir(pp_path):
                                     # calibre might have already deleted it?
                                     try:
-                                        shutil.rmtree(pp_path)
+                                        _fast_rmtree(pp_path)
                                         logger.debug('Deleted %s, %s from %s' %
                                                      (book['NZBtitle'], book['NZBmode'], book['Source'].lower()))
                                     except Exception as why:
                                         logger.debug("Unable to remove %s, %s %s" %
                                                      (pp_path, type(why).__name__, str(why)))
                             else:
-                                if lazylibrarian.CONFIG['DESTINATION_COPY']:
+                                if dest_copy:
                                     logger.debug("Not removing original files as Keep Files is set")
                                 else:
                                     logger.debug("Not removing original files as in download root")
@@ -673,21 +954,24 @@ def processDir(reset=False):
                         update_downloads(book['NZBprov'])
                     else:
                         logger.error('Postprocessing for %s has failed: %s' % (global_name, dest_file))
-                        controlValueDict = {"NZBurl": book['NZBurl'], "Status": "Snatched"}
-                        newValueDict = {"Status": "Failed", "NZBDate": now()}
-                        myDB.upsert("wanted", newValueDict, controlValueDict)
-                        # if it's a book, reset status so we try for a different version
-                        # if it's a magazine, user can select a different one from pastissues table
-                        if book_type == 'eBook':
-                            myDB.action('UPDATE books SET status="Wanted" WHERE BookID=?', (book['BookID'],))
-                        elif book_type == 'AudioBook':
-                            myDB.action('UPDATE books SET audiostatus="Wanted" WHERE BookID=?', (book['BookID'],))
+                        # the failure status writes commit together; only the db
+                        # writes sit inside the transaction, not the file moves
+                        with myDB.transaction():
+                            controlValueDict = {"NZBurl": book['NZBurl'], "Status": "Snatched"}
+                            newValueDict = {"Status": "Failed", "NZBDate": now()}
+                            myDB.upsert("wanted", newValueDict, controlValueDict)
+                            # if it's a book, reset status so we try for a different version
+                            # if it's a magazine, user can select a different one from pastissues table
+                            if book_type == 'eBook':
+                                myDB.action('UPDATE books SET status="Wanted" WHERE BookID=?', (book['BookID'],))
+                            elif book_type == 'AudioBook':
+                                myDB.action('UPDATE books SET audiostatus="Wanted" WHERE BookID=?', (book['BookID'],))
 
                         # at this point, as it failed we should move it or it will get postprocessed
                         # again (and fail again)
                         if os.path.isdir(pp_path + '.fail'):
                             try:
-                                shutil.rmtree(pp_path + '.fail')
+                                _fast_rmtree(pp_path + '.fail')
                             except Exception as why:
                                 logger.debug("Unable to remove %s, %s %s" %
                                              (pp_path + '.fail', type(why).__name__, str(why)))
@@ -702,49 +986,86 @@ def processDir(reset=False):
             # Check for any books in download that weren't marked as snatched, but have a LL.(bookid)
             # do a fresh listdir in case we processed and deleted any earlier
             # and don't process any we've already done as we might not want to delete originals
-            downloads = os.listdir(makeBytestr(download_dir))
-            downloads = [makeUnicode(item) for item in downloads]
-            if int(lazylibrarian.LOGLEVEL) > 2:
+            downloads = list(os.scandir(download_dir))
+            if verbose:
                 logger.debug("Scanning %s entries in %s for LL.(num)" % (len(downloads), download_dir))
+            if any(_ll_id.search(entry.name) for entry in downloads):
+                # one query for all the bookfiles we already have,
+                # rather than one select per directory entry
+                have = dict((row['BookID'], row['BookFile']) for row in
+                            myDB.select('SELECT BookID,BookFile from books WHERE BookFile IS NOT NULL'))
+            else:
+                have = {}
+            ll_pending = False  # LL.(id) entries we couldn't import this time round
             for entry in downloads:
-                if "LL.(" in entry:
-                    dname, extn = os.path.splitext(entry)
-                    if not extn or extn not in skipped_extensions:
-                        bookID = entry.split("LL.(")[1].split(")")[0]
-                        logger.debug("Book with id: %s found in download directory" % bookID)
-                        data = myDB.match('SELECT BookFile from books WHERE BookID=?', (bookID,))
-                        if data and data['BookFile'] and os.path.isfile(data['BookFile']):
-                            logger.debug('Skipping BookID %s, already exists' % bookID)
-                        else:
-                            pp_path = os.path.join(download_dir, entry)
-
-                            if int(lazylibrarian.LOGLEVEL) > 2:
-                                logger.debug("Checking type of %s" % pp_path)
-
-                            if os.path.isfile(pp_path):
-                                if int(lazylibrarian.LOGLEVEL) > 2:
-                                    logger.debug("%s is a file" % pp_path)
-                                pp_path = os.path.join(download_dir)
-
-                            if os.path.isdir(pp_path):
-                                if int(lazylibrarian.LOGLEVEL) > 2:
-                                    logger.debug("%s is a dir" % pp_path)
-                                if import_book(pp_path, bookID):
-                                    if int(lazylibrarian.LOGLEVEL) > 2:
-                                        logger.debug("Imported %s" % pp_path)
-                                    ppcount += 1
+                fname = entry.name
+                # cheapest test first, no point looking for a marker in
+                # failed or incomplete files
+                extn = os.path.splitext(fname)[1]
+                if extn and extn.lower() in _skip_exts:
+                    if verbose:
+                        logger.debug("Skipping extn %s" % fname)
+                    continue
+                ll_match = _ll_id.search(fname)
+                if ll_match:
+                    bookID = ll_match.group(1)
+                    logger.debug("Book with id: %s found in download directory" % bookID)
+                    bookfile = have.get(bookID)
+                    if bookfile and os.path.isfile(bookfile):
+                        logger.debug('Skipping BookID %s, already exists' % bookID)
                     else:
-                        if int(lazylibrarian.LOGLEVEL) > 2:
-                            logger.debug("Skipping extn %s" % entry)
+                        pp_path = entry.path
+
+                        if verbose:
+                            logger.debug("Checking type of %s" % pp_path)
+
+                        if entry.is_file():
+                            if verbose:
+                                logger.debug("%s is a file" % pp_path)
+                            pp_path = os.path.join(download_dir)
+
+                        imported = False
+                        if os.path.isdir(pp_path):
+                            if verbose:
+                                logger.debug("%s is a dir" % pp_path)
+                            if import_book(pp_path, bookID):
+                                if verbose:
+                                    logger.debug("Imported %s" % pp_path)
+                                ppcount += 1
+                                imported = True
+                        if not imported:
+                            ll_pending = True
                 else:
-                    if int(lazylibrarian.LOGLEVEL) > 2:
-                        logger.debug("Skipping (not LL) %s" % entry)
+                    if verbose:
+                        logger.debug("Skipping (not LL) %s" % fname)
+
+            if ll_pending:
+                # an import may succeed once the files finish arriving, which
+                # won't bump the directory mtime, so keep rescanning
+                _last_pp_mtimes.pop(download_dir, None)
+            else:
+                try:
+                    # remember the state we leave the directory in; any later
+                    # add or delete bumps the mtime and forces a rescan
+                    _last_pp_mtimes[download_dir] = os.stat(download_dir).st_mtime
+                except OSError:
+                    _last_pp_mtimes.pop(download_dir, None)
+
+        if extras_pool is not None:
+            # finish the deferred cover/opf work before reporting the sweep done
+            extras_pool.shutdown(wait=True)
+            for job in extra_jobs:
+                try:
+                    job.result()
+                except Exception as e:
+                    logger.error('Deferred cover/opf failed: %s %s' % (type(e).__name__, str(e)))
 
         logger.info('%s book%s/mag%s processed.' % (ppcount, plural(ppcount), plural(ppcount)))
 
         # Now check for any that are still marked snatched...
         snatched = myDB.select('SELECT * from wanted WHERE Status="Snatched"')
-        if lazylibrarian.CONFIG['TASK_AGE'] and len(snatched) > 0:
+        if task_age and len(snatched) > 0:
+            time_now = time.time()
             for book in snatched:
                 book_type = book['AuxInfo']
                 if book_type != 'AudioBook' and book_type != 'eBook':
@@ -755,13 +1076,12 @@ def processDir(reset=False):
                 # FUTURE: we could check percentage downloaded or eta?
                 # if percentage is increasing, it's just slow
                 try:
-                    when_snatched = time.strptime(book['NZBdate'], '%Y-%m-%d %H:%M:%S')
-                    when_snatched = time.mktime(when_snatched)
-                    diff = time.time() - when_snatched  # time difference in seconds
+                    when_snatched = _parse_nzbdate(book['NZBdate'])
+                    diff = time_now - when_snatched  # time difference in seconds
                 except ValueError:
                     diff = 0
                 hours = int(diff / 3600)
-                if hours >= lazylibrarian.CONFIG['TASK_AGE']:
+                if hours >= task_age:
                     if book['Source'] and book['Source'] != 'DIRECT':
                         logger.warn('%s was sent to %s %s hours ago, deleting failed task' %
                                     (book['NZBtitle'], book['Source'].lower(), hours))
@@ -794,27 +1114,32 @@ def processDir(reset=False):
         threading.currentThread().name = "WEBSERVER"
 
 
+def _delete_sab(DownloadID, remove_data):
+    sabnzbd.SABnzbd(DownloadID, 'delete', remove_data)
+    sabnzbd.SABnzbd(DownloadID, 'delhistory', remove_data)
+
+
+# downloader delete functions keyed on wanted.Source, all taking (DownloadID, remove_data)
+_delete_dispatch = {
+    "SABNZBD": _delete_sab,
+    "NZBGET": nzbget.deleteNZB,
+    "UTORRENT": utorrent.removeTorrent,
+    "RTORRENT": rtorrent.removeTorrent,
+    "QBITTORRENT": qbittorrent.removeTorrent,
+    "TRANSMISSION": transmission.removeTorrent,
+    "SYNOLOGY_TOR": synology.removeTorrent,
+    "SYNOLOGY_NZB": synology.removeTorrent,
+    "DELUGEWEBUI": deluge.removeTorrent,
+}
+
+
 def delete_task(Source, DownloadID, remove_data):
     try:
-        if Source == "BLACKHOLE":
+        remove = _delete_dispatch.get(Source)
+        if remove:
+            remove(DownloadID, remove_data)
+        elif Source == "BLACKHOLE":
             logger.warn("Download %s has not been processed from blackhole" % DownloadID)
-        elif Source == "SABNZBD":
-            sabnzbd.SABnzbd(DownloadID, 'delete', remove_data)
-            sabnzbd.SABnzbd(DownloadID, 'delhistory', remove_data)
-        elif Source == "NZBGET":
-            nzbget.deleteNZB(DownloadID, remove_data)
-        elif Source == "UTORRENT":
-            utorrent.removeTorrent(DownloadID, remove_data)
-        elif Source == "RTORRENT":
-            rtorrent.removeTorrent(DownloadID, remove_data)
-        elif Source == "QBITTORRENT":
-            qbittorrent.removeTorrent(DownloadID, remove_data)
-        elif Source == "TRANSMISSION":
-            transmission.removeTorrent(DownloadID, remove_data)
-        elif Source == "SYNOLOGY_TOR" or Source == "SYNOLOGY_NZB":
-            synology.removeTorrent(DownloadID, remove_data)
-        elif Source == "DELUGEWEBUI":
-            deluge.removeTorrent(DownloadID, remove_data)
         elif Source == "DELUGERPC":
             client = DelugeRPCClient(lazylibrarian.CONFIG['DELUGE_HOST'],
                                      lazylibrarian.CONFIG['DELUGE_URL_BASE'],
@@ -844,7 +1169,7 @@ def import_book(pp_path=None, bookID=None):
     try:
         # Move a book into LL folder structure given just the folder and bookID, returns True or False
         # Called from "import_alternate" or if we find a "LL.(xxx)" folder that doesn't match a snatched book/mag
-        if int(lazylibrarian.LOGLEVEL) > 2:
+        if lazylibrarian.LOGLEVEL > 2:
             logger.debug("import_book %s" % pp_path)
         if book_file(pp_path, "audiobook"):
             book_type = "AudioBook"
@@ -891,28 +1216,26 @@ def import_book(pp_path=None, bookID=None):
                 logger.warn('Please check your EBOOK_DEST_FOLDER setting')
                 lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'] = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'].replace('/', '\\')
 
-            dest_path = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER'].replace(
-                            '$Author', authorname).replace(
-                            '$Title', bookname).replace(
-                            '$Series', seriesInfo(bookID)).replace(
-                            '$SerName', seriesInfo(bookID, 'Name')).replace(
-                            '$SerNum', seriesInfo(bookID, 'Num')).replace(
-                            '$$', ' ')
+            template = lazylibrarian.CONFIG['EBOOK_DEST_FOLDER']
+            repl = {'Author': authorname, 'Title': bookname,
+                    'Series': '', 'SerName': '', 'SerNum': '', '$': ' '}
+            if '$Ser' in template:
+                # only hit the series tables when the template asks for them
+                series, sername, sernum = _series_info(bookID)
+                repl['Series'] = series
+                repl['SerName'] = sername or series
+                repl['SerNum'] = sernum or series
+            dest_path = _tmpl_multi.sub(lambda m: repl[m.group(1)], template)
             dest_path = ' '.join(dest_path.split()).strip()
-            dest_path = replace_all(dest_path, __dic__)
+            dest_path = sanitize_name(dest_path)
             dest_path = os.path.join(dest_dir, dest_path)
             # global_name is only used for ebooks to ensure book/cover/opf all have the same basename
             # audiobooks are usually multi part so can't be renamed this way
-            global_name = lazylibrarian.CONFIG['EBOOK_DEST_FILE'].replace(
-                '$Author', authorname).replace(
-                '$Title', bookname).replace(
-                '$Series', '').replace(
-                '$SerName', '').replace(
-                '$SerNum', '').replace(
-                '$$', ' ')
+            repl.update({'Series': '', 'SerName': '', 'SerNum': ''})
+            global_name = _tmpl_multi.sub(lambda m: repl[m.group(1)], lazylibrarian.CONFIG['EBOOK_DEST_FILE'])
             global_name = ' '.join(global_name.split()).strip()
 
-            if int(lazylibrarian.LOGLEVEL) > 2:
+            if lazylibrarian.LOGLEVEL > 2:
                 logger.debug("processDestination %s" % pp_path)
 
             success, dest_file = processDestination(pp_path, dest_path, authorname, bookname,
@@ -921,14 +1244,14 @@ def import_book(pp_path=None, bookID=None):
                 # update nzbs
                 if was_snatched:
                     snatched_from = was_snatched[0]['NZBprov']
-                    if int(lazylibrarian.LOGLEVEL) > 2:
+                    if lazylibrarian.LOGLEVEL > 2:
                         logger.debug("%s was snatched from %s" % (global_name, snatched_from))
                     controlValueDict = {"BookID": bookID}
                     newValueDict = {"Status": "Processed", "NZBDate": now()}  # say when we processed it
                     myDB.upsert("wanted", newValueDict, controlValueDict)
                 else:
                     snatched_from = "manually added"
-                    if int(lazylibrarian.LOGLEVEL) > 2:
+                    if lazylibrarian.LOGLEVEL > 2:
                         logger.debug("%s was %s" % (global_name, snatched_from))
 
                 processExtras(dest_file, global_name, bookID, book_type)
@@ -937,7 +1260,7 @@ def import_book(pp_path=None, bookID=None):
                     if os.path.isdir(pp_path):
                         # calibre might have already deleted it?
                         try:
-                            shutil.rmtree(pp_path)
+                            _fast_rmtree(pp_path)
                         except Exception as why:
                             logger.debug("Unable to remove %s, %s %s" % (pp_path, type(why).__name__, str(why)))
                 else:
@@ -960,7 +1283,7 @@ def import_book(pp_path=None, bookID=None):
                 logger.error('Postprocessing for %s has failed: %s' % (global_name, dest_file))
                 if os.path.isdir(pp_path + '.fail'):
                     try:
-                        shutil.rmtree(pp_path + '.fail')
+                        _fast_rmtree(pp_path + '.fail')
                     except Exception as why:
                         logger.debug("Unable to remove %s, %s %s" % (pp_path + '.fail', type(why).__name__, str(why)))
                 try:
@@ -1050,25 +1373,47 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
 
     booktype = booktype.lower()
 
+    if booktype == 'mag':
+        wanted_exts = frozenset(getList(lazylibrarian.CONFIG['MAG_TYPE']))
+    elif booktype == 'audiobook':
+        wanted_exts = frozenset(getList(lazylibrarian.CONFIG['AUDIOBOOK_TYPE']))
+    else:
+        wanted_exts = frozenset(getList(lazylibrarian.CONFIG['EBOOK_TYPE']))
+
+    # these don't change mid-import, look them up once instead of per file
+    dest_copy = lazylibrarian.CONFIG['DESTINATION_COPY']
+    bookonly = lazylibrarian.CONFIG['IMP_AUTOADD_BOOKONLY']
+    calibre_prog = lazylibrarian.CONFIG['IMP_CALIBREDB']
+
+    def wanted_file(fname):
+        # is_valid_booktype against a prebuilt set, so the config list
+        # isn't re-parsed for every file
+        extn = os.path.splitext(fname)[1].lstrip('.')
+        return bool(extn) and extn.lower() in wanted_exts
+
+    # nothing else touches pp_path while we work on it, so read the
+    # directory once and share the listing between the passes below
+    entries = list(os.scandir(pp_path))
+
     bestmatch = ''
     if booktype == 'ebook' and lazylibrarian.CONFIG['ONE_FORMAT']:
         booktype_list = getList(lazylibrarian.CONFIG['EBOOK_TYPE'])
+        exts = set()
+        for entry in entries:
+            extn = os.path.splitext(entry.name)[1].lstrip('.').lower()
+            if extn:
+                exts.add(extn)
         for btype in booktype_list:
-            if not bestmatch:
-                for fname in os.listdir(makeBytestr(pp_path)):
-                    fname = makeUnicode(fname)
-                    extn = os.path.splitext(fname)[1].lstrip('.')
-                    if extn and extn.lower() == btype:
-                        bestmatch = btype
-                        break
+            if btype in exts:
+                bestmatch = btype
+                break
     if bestmatch:
         match = bestmatch
         logger.debug('One format import, best match = %s' % bestmatch)
     else:  # mag or audiobook or multi-format book
         match = False
-        for fname in os.listdir(makeBytestr(pp_path)):
-            fname = makeUnicode(fname)
-            if is_valid_booktype(fname, booktype=booktype):
+        for entry in entries:
+            if wanted_file(entry.name):
                 match = True
                 break
 
@@ -1079,26 +1424,24 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
 
     # If ebook, do we want calibre to import the book for us
     newbookfile = ''
-    if booktype == 'ebook' and len(lazylibrarian.CONFIG['IMP_CALIBREDB']):
+    if booktype == 'ebook' and len(calibre_prog):
         dest_dir = lazylibrarian.DIRECTORY('eBook')
         try:
             logger.debug('Importing %s into calibre library' % global_name)
             # calibre may ignore metadata.opf and book_name.opf depending on calibre settings,
             # and ignores opf data if there is data embedded in the book file
             # so we send separate "set_metadata" commands after the import
-            for fname in os.listdir(makeBytestr(pp_path)):
-                fname = makeUnicode(fname)
-                if bestmatch and is_valid_booktype(fname, booktype=booktype) and not fname.endswith(bestmatch):
+            clean_global = global_name.replace('"', '_')  # calibre does not like quotes in author names
+            for entry in entries:
+                fname = entry.name
+                if bestmatch and wanted_file(fname) and not fname.endswith(bestmatch):
                     logger.debug("Ignoring %s as not %s" % (fname, bestmatch))
                 else:
-                    filename, extn = os.path.splitext(fname)
-                    # calibre does not like quotes in author names
-                    if lazylibrarian.CONFIG['DESTINATION_COPY']:
-                        shutil.copyfile(os.path.join(pp_path, filename + extn), os.path.join(
-                            pp_path, global_name.replace('"', '_') + extn))
+                    extn = os.path.splitext(fname)[1]
+                    if dest_copy:
+                        _fast_copy(entry.path, os.path.join(pp_path, clean_global + extn))
                     else:
-                        shutil.move(os.path.join(pp_path, filename + extn), os.path.join(
-                            pp_path, global_name.replace('"', '_') + extn))
+                        _fast_move(entry.path, os.path.join(pp_path, clean_global + extn))
 
             if bookid.isdigit():
                 identifier = "goodreads:%s" % bookid
@@ -1108,12 +1451,12 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
             res, err, rc = calibredb('add', ['-1'], [pp_path])
 
             if res:
-                logger.debug('%s result : %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(res)))
+                logger.debug('%s result : %s' % (calibre_prog, unaccented_str(res)))
             if err:
-                logger.debug('%s error  : %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(err)))
+                logger.debug('%s error  : %s' % (calibre_prog, unaccented_str(err)))
 
             if rc or not res:
-                return False, 'calibredb rc %s from %s' % (rc, lazylibrarian.CONFIG['IMP_CALIBREDB'])
+                return False, 'calibredb rc %s from %s' % (rc, calibre_prog)
             elif 'already exist' in err or 'already exist' in res:  # needed for different calibredb versions
                 return False, 'Calibre failed to import %s %s, already exists' % (authorname, bookname)
             elif 'Added book ids' not in res:
@@ -1122,10 +1465,15 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
             calibre_id = res.split("book ids: ", 1)[1].split("\n", 1)[0]
             logger.debug('Calibre ID: %s' % calibre_id)
 
+            # calibre does not like accents in names either, normalise once
+            clean_author = unaccented(authorname)
+            clean_title = unaccented(bookname)
+
+            # one handle serves both the opf lookup and the post-scan check
+            myDB = database.DBConnection()
             our_opf = False
-            if not lazylibrarian.CONFIG['IMP_AUTOADD_BOOKONLY']:
+            if not bookonly:
                 # we can pass an opf with all the info, and a cover image
-                myDB = database.DBConnection()
                 cmd = 'SELECT AuthorName,BookID,BookName,BookDesc,BookIsbn,BookImg,BookDate,BookLang,BookPub'
                 cmd += ' from books,authors WHERE BookID=? and books.AuthorID = authors.AuthorID'
                 data = myDB.match(cmd, (bookid,))
@@ -1137,31 +1485,26 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
                     res, err, rc = calibredb('set_metadata', None, [calibre_id, opfpath])
                     if res and not rc:
                         logger.debug(
-                            '%s set opf reports: %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(res)))
+                            '%s set opf reports: %s' % (calibre_prog, unaccented_str(res)))
 
             if not our_opf:  # pre-existing opf might not have our preferred authorname/title/identifier
-                res, err, rc = calibredb('set_metadata', ['--field', 'authors:%s' % unaccented(authorname)],
+                # set_metadata takes several --field options at once, so one
+                # calibredb startup covers author, title and identifier
+                res, err, rc = calibredb('set_metadata',
+                                         ['--field', 'authors:%s' % clean_author,
+                                          '--field', 'title:%s' % clean_title,
+                                          '--field', 'identifiers:%s' % identifier],
                                          [calibre_id])
                 if res and not rc:
                     logger.debug(
-                        '%s set author reports: %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(res)))
-
-                res, err, rc = calibredb('set_metadata', ['--field', 'title:%s' % unaccented(bookname)], [calibre_id])
-                if res and not rc:
-                    logger.debug(
-                        '%s set title reports: %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(res)))
-
-                res, err, rc = calibredb('set_metadata', ['--field', 'identifiers:%s' % identifier], [calibre_id])
-                if res and not rc:
-                    logger.debug(
-                        '%s set identifier reports: %s' % (lazylibrarian.CONFIG['IMP_CALIBREDB'], unaccented_str(res)))
+                        '%s set fields reports: %s' % (calibre_prog, unaccented_str(res)))
 
             # calibre does not like accents or quotes in names
             if authorname.endswith('.'):  # calibre replaces trailing dot with underscore eg Jr. becomes Jr_
                 authorname = authorname[:-1] + '_'
             calibre_dir = os.path.join(dest_dir, unaccented_str(authorname.replace('"', '_')), '')
             if os.path.isdir(calibre_dir):  # assumed author directory
-                target_dir = os.path.join(calibre_dir, '%s (%s)' % (unaccented(bookname), calibre_id))
+                target_dir = os.path.join(calibre_dir, '%s (%s)' % (clean_title, calibre_id))
                 logger.debug('Calibre trying directory [%s]' % target_dir)
                 remove = bool(lazylibrarian.CONFIG['FULL_SCAN'])
                 if os.path.isdir(target_dir):
@@ -1169,14 +1512,11 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
                     newbookfile = book_file(target_dir, booktype='ebook')
                     if newbookfile:
                         setperm(target_dir)
-                        for fname in os.listdir(makeBytestr(target_dir)):
-                            fname = makeUnicode(fname)
-                            setperm(os.path.join(target_dir, fname))
+                        _setperm_dir(target_dir)
                         return True, newbookfile
                     return False, "Failed to find a valid ebook in [%s]" % target_dir
                 else:
                     _ = LibraryScan(calibre_dir, remove=remove)  # rescan whole authors directory
-                    myDB = database.DBConnection()
                     match = myDB.match('SELECT BookFile FROM books WHERE BookID=?', (bookid,))
                     if match:
                         return True, match['BookFile']
@@ -1187,7 +1527,7 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
             return False, 'calibredb import failed, %s %s' % (type(e).__name__, str(e))
     else:
         # we are copying the files ourselves, either it's audiobook, magazine or we don't want to use calibre
-        logger.debug("BookType: %s, calibredb: [%s]" % (booktype, lazylibrarian.CONFIG['IMP_CALIBREDB']))
+        logger.debug("BookType: %s, calibredb: [%s]" % (booktype, calibre_prog))
         if not os.path.exists(dest_path):
             logger.debug('%s does not exist, so it\'s safe to create it' % dest_path)
         elif not os.path.isdir(dest_path):
@@ -1205,31 +1545,31 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
 
         # ok, we've got a target directory, try to copy only the files we want, renaming them on the fly.
         firstfile = ''  # try to keep track of "preferred" ebook type or the first part of multi-part audiobooks
-        for fname in os.listdir(makeBytestr(pp_path)):
-            fname = makeUnicode(fname)
-            if bestmatch and is_valid_booktype(fname, booktype=booktype) and not fname.endswith(bestmatch):
+        for entry in entries:
+            fname = entry.name
+            if bestmatch and wanted_file(fname) and not fname.endswith(bestmatch):
                 logger.debug("Ignoring %s as not %s" % (fname, bestmatch))
             else:
-                if is_valid_booktype(fname, booktype=booktype) or \
+                if wanted_file(fname) or \
                         ((fname.lower().endswith(".jpg") or fname.lower().endswith(".opf"))
-                         and not lazylibrarian.CONFIG['IMP_AUTOADD_BOOKONLY']):
+                         and not bookonly):
                     logger.debug('Copying %s to directory %s' % (fname, dest_path))
                     typ = ''
-                    srcfile = os.path.join(pp_path, fname)
+                    srcfile = entry.path
                     if booktype == 'audiobook':
                         destfile = os.path.join(dest_path, fname)  # don't rename, just copy it
                     else:
                         # for ebooks, the book, jpg, opf all have the same basename
                         destfile = os.path.join(dest_path, global_name + os.path.splitext(fname)[1])
                     try:
-                        if lazylibrarian.CONFIG['DESTINATION_COPY']:
+                        if dest_copy:
                             typ = 'copy'
-                            shutil.copyfile(srcfile, destfile)
+                            _fast_copy(srcfile, destfile)
                         else:
                             typ = 'move'
-                            shutil.move(srcfile, destfile)
+                            _fast_move(srcfile, destfile)
                         setperm(destfile)
-                        if is_valid_booktype(destfile, booktype=booktype):
+                        if wanted_file(destfile):
                             newbookfile = destfile
                     except Exception as why:
                         return False, "Unable to %s file %s to %s: %s %s" % \
@@ -1250,17 +1590,26 @@ def processDestination(pp_path=None, dest_path=None, authorname=None, bookname=N
 
         # link to the first part of multi-part audiobooks
         elif booktype == 'audiobook':
+            # read the directory once and try each token against the cached
+            # names, rather than a fresh directory scan per token
+            parts = [entry.name for entry in os.scandir(pp_path) if wanted_file(entry.name)]
+            # one pass over the names keeping the best-ranked token, rather
+            # than one scan of the whole listing per token
             tokmatch = ''
-            for token in [' 001.', ' 01.', ' 1.', ' 001 ', ' 01 ', ' 1 ', '01']:
-                if tokmatch:
-                    break
-                for f in os.listdir(makeBytestr(pp_path)):
-                    f = makeUnicode(f)
-                    if is_valid_booktype(f, booktype='audiobook') and token in f:
-                        firstfile = os.path.join(pp_path, f)
-                        logger.debug("Link to preferred part [%s], %s" % (token, f))
+            best_rank = len(_part_tokens)
+            for f in parts:
+                for rank, token in enumerate(_part_tokens):
+                    if rank >= best_rank:
+                        break
+                    if token in f:
                         tokmatch = token
+                        best_rank = rank
+                        firstfile = os.path.join(pp_path, f)
                         break
+                if not best_rank:
+                    break
+            if tokmatch:
+                logger.debug("Link to preferred part [%s], %s" % (tokmatch, os.path.basename(firstfile)))
         if firstfile:
             newbookfile = firstfile
     return True, newbookfile
@@ -1278,8 +1627,7 @@ def processAutoAdd(src_path=None, booktype='book'):
         return False
     # Now try and copy all the book files into a single dir.
     try:
-        names = os.listdir(makeBytestr(src_path))
-        names = [makeUnicode(item) for item in names]
+        names = os.listdir(src_path)
         # files jpg, opf & book(s) should have same name
         # Caution - book may be pdf, mobi, epub or all 3.
         # for now simply copy all files, and let the autoadder sort it out
@@ -1290,48 +1638,78 @@ def processAutoAdd(src_path=None, booktype='book'):
 
         match = False
         if booktype == 'book' and lazylibrarian.CONFIG['ONE_FORMAT']:
+            # keep the format that appears earliest in the EBOOK_TYPE
+            # preference list, in one pass over the names rather than a
+            # rescan per format (which could spin forever when nothing matched)
             booktype_list = getList(lazylibrarian.CONFIG['EBOOK_TYPE'])
-            for booktype in booktype_list:
-                while not match:
-                    for name in names:
-                        extn = os.path.splitext(name)[1].lstrip('.')
-                        if extn and extn.lower() == booktype:
-                            match = booktype
-                            break
-        copied = False
+            priority = dict((extn, pos) for pos, extn in enumerate(booktype_list))
+            best = len(booktype_list)
+            for name in names:
+                extn = os.path.splitext(name)[1].lstrip('.').lower()
+                pos = priority.get(extn, best)
+                if pos < best:
+                    best = pos
+                    match = booktype_list[pos]
+                    if not pos:
+                        break
+        if booktype == 'mag':
+            wanted_exts = frozenset(getList(lazylibrarian.CONFIG['MAG_TYPE']))
+        else:
+            wanted_exts = frozenset(getList(lazylibrarian.CONFIG['EBOOK_TYPE']))
+        only_wanted = (booktype == 'book' and lazylibrarian.CONFIG['IMP_AUTOADD_BOOKONLY']) or \
+                      (booktype == 'mag' and lazylibrarian.CONFIG['IMP_AUTOADD_MAGONLY'])
+        to_copy = []
+        skipped = []
         for name in names:
-            if match and is_valid_booktype(name, booktype=booktype) and not name.endswith(match):
-                logger.debug('Skipping %s' % os.path.splitext(name)[1])
-            elif booktype == 'book' and lazylibrarian.CONFIG['IMP_AUTOADD_BOOKONLY'] and not \
-                    is_valid_booktype(name, booktype="book"):
-                logger.debug('Skipping %s' % name)
-            elif booktype == 'mag' and lazylibrarian.CONFIG['IMP_AUTOADD_MAGONLY'] and not \
-                    is_valid_booktype(name, booktype="mag"):
-                logger.debug('Skipping %s' % name)
+            extn = os.path.splitext(name)[1].lstrip('.').lower()
+            if match and extn in wanted_exts and not name.endswith(match):
+                skipped.append(name)
+            elif only_wanted and extn not in wanted_exts:
+                skipped.append(name)
             else:
-                srcname = os.path.join(src_path, name)
-                dstname = os.path.join(autoadddir, name)
-                try:
-                    if lazylibrarian.CONFIG['DESTINATION_COPY']:
-                        logger.debug('AutoAdd Copying file [%s] from [%s] to [%s]' % (name, srcname, dstname))
-                        shutil.copyfile(srcname, dstname)
-                    else:
-                        logger.debug('AutoAdd Moving file [%s] from [%s] to [%s]' % (name, srcname, dstname))
-                        shutil.move(srcname, dstname)
-                    copied = True
-                except Exception as why:
-                    logger.error('AutoAdd - Failed to copy/move file [%s] %s [%s] ' %
-                                 (name, type(why).__name__, str(why)))
-                    return False
-                try:
-                    os.chmod(dstname, 0o666)  # make rw for calibre
-                except OSError as why:
-                    logger.warn("Could not set permission of %s because [%s]" % (dstname, why.strerror))
-                    # permissions might not be fatal, continue
+                to_copy.append(name)
 
-        if copied and not lazylibrarian.CONFIG['DESTINATION_COPY']:  # do we want to keep the original files?
+        if skipped:
+            # one line for the lot, a debug line per file adds up on big nested dirs
+            logger.debug('AutoAdd skipping %s file%s: %s' % (len(skipped), plural(len(skipped)), ', '.join(skipped)))
+
+        dest_copy = lazylibrarian.CONFIG['DESTINATION_COPY']
+        copied = False
+        perm_failed = 0
+        for name in to_copy:
+            srcname = os.path.join(src_path, name)
+            dstname = os.path.join(autoadddir, name)
+            try:
+                if dest_copy:
+                    logger.debug('AutoAdd Copying file [%s] from [%s] to [%s]' % (name, srcname, dstname))
+                    _fast_copy(srcname, dstname)
+                else:
+                    logger.debug('AutoAdd Moving file [%s] from [%s] to [%s]' % (name, srcname, dstname))
+                    _fast_move(srcname, dstname)
+                copied = True
+            except Exception as why:
+                logger.error('AutoAdd - Failed to copy/move file [%s] %s [%s] ' %
+                             (name, type(why).__name__, str(why)))
+                return False
+            try:
+                os.chmod(dstname, 0o666)  # make rw for calibre
+            except OSError:
+                perm_failed += 1
+                # permissions might not be fatal, continue
+
+        if perm_failed:
+            logger.warn("Could not set permission on %s file%s in %s" %
+                        (perm_failed, plural(perm_failed), autoadddir))
+        if copied and not dest_copy:  # do we want to keep the original files?
             logger.debug('Removing %s' % src_path)
-            shutil.rmtree(src_path)
+            if skipped:
+                shutil.rmtree(src_path)
+            else:
+                # everything was moved out, so the dir should already be empty
+                try:
+                    os.rmdir(src_path)
+                except OSError:
+                    shutil.rmtree(src_path)
 
     except OSError as why:
         logger.error('AutoAdd - Failed because [%s]' % why.strerror)
@@ -1360,10 +1738,16 @@ def processIMG(dest_path=None, bookid=None, bookimg=None, global_name=None):
     cachefile = os.path.join(lazylibrarian.CACHEDIR, 'book', bookid + '.jpg')
     coverfile = os.path.join(dest_path, global_name + '.jpg')
     try:
-        shutil.copyfile(cachefile, coverfile)
-    except Exception as e:
-        logger.debug("Error copying image to %s, %s %s" % (coverfile, type(e).__name__, str(e)))
-        return
+        # the cache copy was just written, a hardlink shares its blocks
+        # instead of writing the jpeg out a second time
+        os.link(cachefile, coverfile)
+    except (AttributeError, OSError):
+        # cross-device, unsupported or coverfile exists - fall back to a copy
+        try:
+            _fast_copy(cachefile, coverfile)
+        except Exception as e:
+            logger.debug("Error copying image to %s, %s %s" % (coverfile, type(e).__name__, str(e)))
+            return
 
 
 def processMAGOPF(issuefile, title, issue, issueID):
@@ -1448,52 +1832,40 @@ def processOPF(dest_path=None, data=None, global_name=None, overwrite=False):
                     seriesname = "%s %s" % (seriesname, serieslist)
                     seriesnum = 1
 
-    opfinfo = '<?xml version="1.0"  encoding="UTF-8"?>\n\
-<package version="2.0" xmlns="http://www.idpf.org/2007/opf" >\n\
-    <metadata xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:opf="http://www.idpf.org/2007/opf">\n\
-        <dc:title>%s</dc:title>\n\
-        <dc:creator opf:file-as="%s" opf:role="aut">%s</dc:creator>\n\
-        <dc:language>%s</dc:language>\n\
-        <dc:identifier scheme="%s">%s</dc:identifier>\n' % (data['BookName'], surnameFirst(data['AuthorName']),
-                                                            data['AuthorName'], data['BookLang'], scheme, bookid)
+    author_fileas = surnameFirst(data['AuthorName'])
+
+    # collect the fragments and join once, rather than growing a string
+    parts = [_opf_header % {'title': data['BookName'], 'fileas': author_fileas,
+                            'author': data['AuthorName'], 'lang': data['BookLang'],
+                            'scheme': scheme, 'bookid': bookid}]
 
     if 'BookIsbn' in data:
-        opfinfo += '        <dc:identifier scheme="ISBN">%s</dc:identifier>\n' % data['BookIsbn']
+        parts.append(_opf_isbn % data['BookIsbn'])
 
     if 'BookPub' in data:
-        opfinfo += '        <dc:publisher>%s</dc:publisher>\n' % data['BookPub']
+        parts.append(_opf_pub % data['BookPub'])
 
     if 'BookDate' in data:
-        opfinfo += '        <dc:date>%s</dc:date>\n' % data['BookDate']
+        parts.append(_opf_date % data['BookDate'])
 
     if 'BookDesc' in data:
-        opfinfo += '        <dc:description>%s</dc:description>\n' % data['BookDesc']
+        parts.append(_opf_desc % data['BookDesc'])
 
     if seriesname:
-        opfinfo += '        <meta content="%s" name="calibre:series"/>\n' % seriesname
+        parts.append(_opf_series % seriesname)
     elif 'Series' in data:
-        opfinfo += '        <meta content="%s" name="calibre:series"/>\n' % data['Series']
+        parts.append(_opf_series % data['Series'])
 
     if seriesnum:
-        opfinfo += '        <meta content="%s" name="calibre:series_index"/>\n' % seriesnum
+        parts.append(_opf_index % seriesnum)
     elif 'Series_index' in data:
-        opfinfo += '        <meta content="%s" name="calibre:series_index"/>\n' % data['Series_index']
-
-    opfinfo += '        <guide>\n\
-            <reference href="%s.jpg" type="cover" title="Cover"/>\n\
-        </guide>\n\
-    </metadata>\n\
-</package>' % global_name  # file in current directory, not full path
+        parts.append(_opf_index % data['Series_index'])
 
-    dic = {'...': '', ' & ': ' ', ' = ': ' ', '$': 's', ' + ': ' ', '*': ''}
+    parts.append(_opf_guide % global_name)  # file in current directory, not full path
 
-    opfinfo = unaccented_str(replace_all(opfinfo, dic))
+    opfinfo = unaccented_str(_opf_multi.sub(_opf_scrub, ''.join(parts)))
 
-    if PY2:
-        fmode = 'wb'
-    else:
-        fmode = 'w'
-    with open(opfpath, fmode) as opf:
+    with open(opfpath, 'w') as opf:
         opf.write(opfinfo)
     logger.debug('Saved metadata to: ' + opfpath)
     return opfpath, True
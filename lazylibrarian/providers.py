@@ -15,7 +15,7 @@
 
 import time
 import datetime
-import urllib
+import urllib.parse
 import threading
 from xml.etree import ElementTree
 
@@ -673,7 +673,7 @@ def NewzNabPlus(book=None, provider=None, searchType=None, searchMode=None, test
             host = 'http://' + host
         if host[-1:] == '/':
             host = host[:-1]
-        URL = host + '/api?' + urllib.urlencode(params)
+        URL = host + '/api?' + urllib.parse.urlencode(params)
 
         sterm = makeUnicode(book['searchterm'])
 
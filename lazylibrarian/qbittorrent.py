@@ -13,7 +13,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
-import cookielib
+import http.cookiejar as cookielib
 import json
 import mimetypes
 import os
@@ -21,8 +21,8 @@ import platform
 import random
 import string
 import time
-import urllib
-import urllib2
+import urllib.parse
+import urllib.request as urllib2
 
 import lazylibrarian
 from lazylibrarian import logger
@@ -76,7 +76,7 @@ class qbittorrentclient(object):
 
     def _get_sid(self, base_url, username, password):
         # login so we can capture SID cookie
-        login_data = makeBytestr(urllib.urlencode({'username': username, 'password': password}))
+        login_data = makeBytestr(urllib.parse.urlencode({'username': username, 'password': password}))
         try:
             _ = self.opener.open(base_url + '/login', login_data)
         except Exception as err:
@@ -97,7 +97,7 @@ class qbittorrentclient(object):
             data, headers = encode_multipart(args, files, '-------------------------acebdf13572468')
         else:
             if args:
-                data = makeBytestr(urllib.urlencode(args))
+                data = makeBytestr(urllib.parse.urlencode(args))
             if content_type:
                 headers['Content-Type'] = content_type
 
@@ -15,7 +15,7 @@
 
 
 import socket
-import xmlrpclib
+import xmlrpc.client as xmlrpclib
 from time import sleep
 
 import lazylibrarian
@@ -17,7 +17,7 @@ try:
 except ImportError:
     import lib.requests as requests
 
-import urllib
+import urllib.parse
 import lazylibrarian
 from lazylibrarian import logger
 from lazylibrarian.common import proxyList
@@ -126,7 +126,7 @@ def SABnzbd(title=None, nzburl=None, remove_data=False):
 #    if lazylibrarian.SAB_PP:
 #        params["script"] = lazylibrarian.SAB_SCRIPT
 
-    URL = HOST + "/api?" + urllib.urlencode(params)
+    URL = HOST + "/api?" + urllib.parse.urlencode(params)
 
     # to debug because of api
     logger.debug('Request url for <a href="%s">SABnzbd</a>' % URL)
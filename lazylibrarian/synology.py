@@ -15,7 +15,7 @@
 
 
 import json
-import urllib
+import urllib.parse
 
 import lazylibrarian
 from lazylibrarian import logger
@@ -27,7 +27,7 @@ def _getJSON(URL, params):
     # Get JSON response from URL
     # Return json,True or error_msg,False
 
-    URL += "/?%s" % urllib.urlencode(params)
+    URL += "/?%s" % urllib.parse.urlencode(params)
     result, success = fetchURL(URL, retry=False)
     if success:
         try:
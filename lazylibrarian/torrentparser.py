@@ -14,8 +14,8 @@
 #  along with Lazylibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
 import traceback
-import urllib
-import urlparse
+import urllib.parse
+import urllib.parse as urlparse
 
 import lazylibrarian
 import lib.feedparser as feedparser
@@ -30,8 +30,8 @@ def url_fix(s, charset='utf-8'):
     if isinstance(s, text_type):
         s = s.encode(charset, 'ignore')
     scheme, netloc, path, qs, anchor = urlparse.urlsplit(s)
-    path = urllib.quote(path, '/%')
-    qs = urllib.quote_plus(qs, ':&=')
+    path = urllib.parse.quote(path, '/%')
+    qs = urllib.parse.quote_plus(qs, ':&=')
     return urlparse.urlunsplit((scheme, netloc, path, qs, anchor))
 
 
@@ -69,7 +69,7 @@ def TPB(book=None, test=False):
             "orderby": "99"
         }
 
-        searchURL = providerurl + "?%s" % urllib.urlencode(params)
+        searchURL = providerurl + "?%s" % urllib.parse.urlencode(params)
 
         next_page = False
         result, success = fetchURL(searchURL)
@@ -179,14 +179,14 @@ def KAT(book=None, test=False):
     if not host.startswith('http'):
         host = 'http://' + host
 
-    providerurl = url_fix(host + "/usearch/" + urllib.quote(book['searchterm']))
+    providerurl = url_fix(host + "/usearch/" + urllib.parse.quote(book['searchterm']))
 
     params = {
         "category": "books",
         "field": "seeders",
         "sorder": "desc"
     }
-    searchURL = providerurl + "/?%s" % urllib.urlencode(params)
+    searchURL = providerurl + "/?%s" % urllib.parse.urlencode(params)
 
     sterm = makeUnicode(book['searchterm'])
 
@@ -320,7 +320,7 @@ def WWT(book=None, test=False):
             "page": page,
             "cat": cat
         }
-        searchURL = providerurl + "/?%s" % urllib.urlencode(params)
+        searchURL = providerurl + "/?%s" % urllib.parse.urlencode(params)
 
         next_page = False
         result, success = fetchURL(searchURL)
@@ -440,7 +440,7 @@ def EXTRA(book=None, test=False):
         "s_cat": "2",
         "search": book['searchterm']
     }
-    searchURL = providerurl + "/?%s" % urllib.urlencode(params)
+    searchURL = providerurl + "/?%s" % urllib.parse.urlencode(params)
 
     sterm = makeUnicode(book['searchterm'])
 
@@ -523,7 +523,7 @@ def ZOO(book=None, test=False):
         "category": "books",
         "fmt": "rss"
     }
-    searchURL = providerurl + "?%s" % urllib.urlencode(params)
+    searchURL = providerurl + "?%s" % urllib.parse.urlencode(params)
 
     sterm = makeUnicode(book['searchterm'])
 
@@ -607,7 +607,7 @@ def LIME(book=None, test=False):
         "q": book['searchterm']
     }
     providerurl = url_fix(host + "/searchrss/other")
-    searchURL = providerurl + "?%s" % urllib.urlencode(params)
+    searchURL = providerurl + "?%s" % urllib.parse.urlencode(params)
 
     sterm = makeUnicode(book['searchterm'])
 
@@ -696,7 +696,7 @@ def TDL(book=None, test=False):
         "cid": "2",
         "search": book['searchterm']
     }
-    searchURL = providerurl + "/rss.xml?%s" % urllib.urlencode(params)
+    searchURL = providerurl + "/rss.xml?%s" % urllib.parse.urlencode(params)
 
     sterm = makeUnicode(book['searchterm'])
 
@@ -15,7 +15,7 @@
 
 import json
 import time
-import urlparse
+import urllib.parse as urlparse
 try:
     import requests
 except ImportError:
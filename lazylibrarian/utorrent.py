@@ -13,12 +13,12 @@
 #  You should have received a copy of the GNU General Public License
 #  along with LazyLibrarian.  If not, see <http://www.gnu.org/licenses/>.
 
-import cookielib
+import http.cookiejar as cookielib
 import json
 import re
-import urllib
-import urllib2
-import urlparse
+import urllib.parse
+import urllib.request as urllib2
+import urllib.parse as urlparse
 
 import lazylibrarian
 from lazylibrarian import logger
@@ -145,7 +145,7 @@ class utorrentclient(object):
         return self._action(params)
 
     def _action(self, params, body=None, content_type=None):
-        url = self.base_url + '/gui/' + '?token=' + self.token + '&' + urllib.urlencode(params)
+        url = self.base_url + '/gui/' + '?token=' + self.token + '&' + urllib.parse.urlencode(params)
         request = urllib2.Request(url)
         if lazylibrarian.CONFIG['PROXY_HOST']:
             for item in getList(lazylibrarian.CONFIG['PROXY_TYPE']):
@@ -20,7 +20,7 @@ import random
 import re
 import threading
 import time
-import urllib
+import urllib.parse
 from shutil import copyfile, rmtree
 from lib.six import PY2
 
@@ -1082,7 +1082,7 @@ class WebInterface(object):
             authorname = authorname.encode(lazylibrarian.SYS_ENCODING)
 
         return serve_template(
-            templatename="author.html", title=urllib.quote_plus(authorname),
+            templatename="author.html", title=urllib.parse.quote_plus(authorname),
             author=author, languages=languages, booklang=BookLang, types=types, library=library, ignored=Ignored,
             showseries=lazylibrarian.SHOW_SERIES)
 
@@ -2294,7 +2294,7 @@ class WebInterface(object):
                 temp_title = mag['Title']
                 if PY2:
                     temp_title = temp_title.encode(lazylibrarian.SYS_ENCODING)
-                this_mag['safetitle'] = urllib.quote_plus(temp_title)
+                this_mag['safetitle'] = urllib.parse.quote_plus(temp_title)
                 mags.append(this_mag)
 
             if lazylibrarian.CONFIG['HTTP_LOOK'] == 'legacy':
@@ -2421,7 +2421,7 @@ class WebInterface(object):
 
     @cherrypy.expose
     def openMag(self, bookid=None):
-        bookid = urllib.unquote_plus(bookid)
+        bookid = urllib.parse.unquote_plus(bookid)
         myDB = database.DBConnection()
         # we may want to open an issue with a hashed bookid
         mag_data = myDB.match('SELECT * from issues WHERE IssueID=?', (bookid,))
@@ -2444,7 +2444,7 @@ class WebInterface(object):
             logger.debug("%s has %s issue%s" % (bookid, len(mag_data), plural(len(mag_data))))
             if PY2:
                 bookid = bookid.encode(lazylibrarian.SYS_ENCODING)
-            raise cherrypy.HTTPRedirect("issuePage?title=%s" % urllib.quote_plus(bookid))
+            raise cherrypy.HTTPRedirect("issuePage?title=%s" % urllib.parse.quote_plus(bookid))
 
     @cherrypy.expose
     def markPastIssues(self, action=None, **args):
@@ -2635,7 +2635,7 @@ class WebInterface(object):
     @cherrypy.expose
     def searchForMag(self, bookid=None):
         myDB = database.DBConnection()
-        bookid = urllib.unquote_plus(bookid)
+        bookid = urllib.parse.unquote_plus(bookid)
         bookdata = myDB.match('SELECT * from magazines WHERE Title=?', (bookid,))
         if bookdata:
             # start searchthreads
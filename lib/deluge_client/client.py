@@ -11,7 +11,13 @@ RPC_ERROR = 2
 RPC_EVENT = 3
 
 #MESSAGE_HEADER_SIZE = 5
-READ_SIZE = 10
+READ_SIZE = 65536
+
+# one shared context; no certificate checking, matching the old
+# ssl.wrap_socket behaviour as deluge daemons use self-signed certs
+_ssl_context = ssl.SSLContext(getattr(ssl, 'PROTOCOL_TLS', ssl.PROTOCOL_SSLv23))
+_ssl_context.check_hostname = False
+_ssl_context.verify_mode = ssl.CERT_NONE
 
 #logger = logging.getLogger(__name__)
 
@@ -33,8 +39,8 @@ class DelugeRPCClient(object):
 
         self.request_id = 0
         self.connected = False
-        self._socket = ssl.wrap_socket(socket.socket(socket.AF_INET, socket.SOCK_STREAM))
-        self._socket.settimeout(self.timeout)
+        # socket is created in connect(), clients may be built and never used
+        self._socket = None
 
     def connect(self):
         """
@@ -45,7 +51,14 @@ class DelugeRPCClient(object):
             return False
 
         logger.info('Connecting to %s:%s' % (self.host, self.port))
+        self._socket = _ssl_context.wrap_socket(socket.socket(socket.AF_INET, socket.SOCK_STREAM))
+        self._socket.settimeout(self.timeout)
         self._socket.connect((self.host, self.port))
+        try:
+            # rpc is strict request/response, don't let nagle hold small requests
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, socket.error):
+            pass
         logger.debug('Connected to Deluge, logging in')
         if self.username:
             result = self.call('daemon.login', self.username, self.password)
@@ -64,26 +77,34 @@ class DelugeRPCClient(object):
         req = ((self.request_id, method, args, kwargs), )
         req = zlib.compress(dumps(req))
 
+        # protocol v1 has no length-prefixed framing; the 'D' + length header
+        # below belongs to the newer protocol and older daemons reject it, so
+        # the end of a response is detected from the zlib stream end instead
         #self._socket.send('D' + struct.pack("!i", len(req))) # seems to be for the future !
-        self._socket.send(req)
-
-        data = b''
+        # send() may short-write on a slow socket, sendall retries until done
+        self._socket.sendall(req)
+
+        # feed each chunk to an incremental decompressor rather than
+        # retrying zlib.decompress on the whole accumulated buffer,
+        # which went quadratic on large responses
+        dec = zlib.decompressobj()
+        buf = bytearray()  # amortised O(1) append, unlike += on bytes
         while True:
             try:
                 d = self._socket.recv(READ_SIZE)
             except ssl.SSLError:
                 raise CallTimeoutException()
 
-            data += d
+            if not d:
+                raise ConnectionLostException()
             try:
-                data = zlib.decompress(data)
+                buf.extend(dec.decompress(d))
             except zlib.error:
-                if not d:
-                    raise ConnectionLostException()
-                continue
-            break
+                raise ConnectionLostException()
+            if dec.eof:
+                break
 
-        data = list(loads(data))
+        data = list(loads(bytes(buf)))
         msg_type = data.pop(0)
         request_id = data.pop(0)
 
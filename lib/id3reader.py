@@ -29,7 +29,7 @@ _simpleDataMapping = {
 # Tracing
 _t = False
 def _trace(msg):
-    print msg
+    print(msg)
 
 # Coverage
 _c = False
@@ -163,7 +163,7 @@ class _Frame:
                 self.rawData = zlib.decompress(self.rawData[5:])
             else:
                 #if _c: _coverage('badcdm!')
-                raise Id3Error, 'Unknown CDM compression: %02x' % self.rawData[0]
+                raise Id3Error('Unknown CDM compression: %02x' % self.rawData[0])
             #@TODO: re-interpret the decompressed frame.
 
         elif self.id in _simpleDataMapping['comment']:
@@ -227,14 +227,14 @@ class Reader:
         #if _t: _trace("ask %d (%s)" % (num,desc))
         if num > self.bytesLeft:
             #if _c: _coverage('long!')
-            raise Id3Error, 'Long read (%s): (%d > %d)' % (desc, num, self.bytesLeft)
+            raise Id3Error('Long read (%s): (%d > %d)' % (desc, num, self.bytesLeft))
         bytes = self.file.read(num)
         self.bytesLeft -= num
 
         if len(bytes) < num:
             #if _t: _trace("short read with %d left, %d total" % (self.bytesLeft, self.header.size))
             #if _c: _coverage('short!')
-            raise Id3Error, 'Short read (%s): (%d < %d)' % (desc, len(bytes), num)
+            raise Id3Error('Short read (%s): (%d < %d)' % (desc, len(bytes), num))
 
         if self.header.bUnsynchronized:
             nUnsync = 0
@@ -336,7 +336,7 @@ class Reader:
             self._readFrame = self._readFrame_rev4
         else:
             #if _c: _coverage('badmajor!')
-            raise Id3Error, "Unsupported major version: %d" % self.header.majorVersion
+            raise Id3Error("Unsupported major version: %d" % self.header.majorVersion)
 
         # Interpret the flags
         self._interpretFlags()
@@ -550,10 +550,10 @@ class Reader:
             or return None if there is no such value.
         """
         if PY2:
-            if self.frames.has_key(id):
+            if id in self.frames:
                 if hasattr(self.frames[id], 'value'):
                     return self.frames[id].value
-            if _simpleDataMapping.has_key(id):
+            if id in _simpleDataMapping:
                 for id2 in _simpleDataMapping[id]:
                     v = self.getValue(id2)
                     if v:
@@ -572,7 +572,7 @@ class Reader:
 
     def getRawData(self, id):
         if PY2:
-            if self.frames.has_key(id):
+            if id in self.frames:
                 return self.frames[id].rawData
         else:
             if bytes(id, 'utf-8') in self.frames:
@@ -582,32 +582,32 @@ class Reader:
 
     def dump(self):
         import pprint
-        print "Header:"
-        print self.header
-        print "Frames:"
+        print("Header:")
+        print(self.header)
+        print("Frames:")
         for fr in self.allFrames:
             if len(fr.rawData) > 30:
                 fr.rawData = fr.rawData[:30]
         pprint.pprint(self.allFrames)
         for fr in self.allFrames:
             if hasattr(fr, 'value'):
-                print '%s: %s' % (fr.id, _safestr(fr.value))
+                print('%s: %s' % (fr.id, _safestr(fr.value)))
             else:
-                print '%s= %s' % (fr.id, _safestr(fr.rawData))
+                print('%s= %s' % (fr.id, _safestr(fr.rawData)))
         for label in _simpleDataMapping.keys():
             v = self.getValue(label)
             if v:
-                print 'Label %s: %s' % (label, _safestr(v))
+                print('Label %s: %s' % (label, _safestr(v)))
 
     def dumpCoverage(self):
         feats = _features.keys()
         feats.sort()
         for feat in feats:
-            print "Feature %-12s: %d" % (feat, _features[feat])
+            print("Feature %-12s: %d" % (feat, _features[feat]))
 
 if __name__ == '__main__':
     if len(sys.argv) < 2 or '-?' in sys.argv:
-        print "Give me a filename"
+        print("Give me a filename")
     else:
         id3 = Reader(sys.argv[1])
         id3.dump()
@@ -12,8 +12,8 @@ import os
 import unittest
 from struct import *
 from pprint import pprint
-import utils
-from lz77 import uncompress_lz77
+from . import utils
+from .lz77 import uncompress_lz77
 
 mobilangdict = {
 		54 : {0 : 'af'}, # Afrikaans
@@ -167,7 +167,7 @@ class Mobi:
         self.f = open(filename, "rb");
       else:
         self.f = filename;
-    except IOError,e:
+    except IOError as e:
       sys.stderr.write("Could not open %s! " % filename);
       raise e;
     self.offset = 0;
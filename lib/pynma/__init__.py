@@ -1,4 +1,4 @@
 #!/usr/bin/python
 
-from pynma import PyNMA 
+from .pynma import PyNMA
 
@@ -13,6 +13,10 @@ import copy
 import time
 import calendar
 import collections
+try:
+    import collections.abc as _collections_abc
+except ImportError:  # python2
+    import collections as _collections_abc
 
 from ._internal_utils import to_native_string
 from .compat import cookielib, urlparse, urlunparse, Morsel
@@ -171,7 +175,7 @@ class CookieConflictError(RuntimeError):
     """
 
 
-class RequestsCookieJar(cookielib.CookieJar, collections.MutableMapping):
+class RequestsCookieJar(cookielib.CookieJar, _collections_abc.MutableMapping):
     """Compatibility class; is a cookielib.CookieJar, but exposes a dict
     interface.
 
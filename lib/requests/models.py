@@ -8,6 +8,10 @@ This module contains the primary objects that power Requests.
 """
 
 import collections
+try:
+    import collections.abc as _collections_abc
+except ImportError:  # python2
+    import collections as _collections_abc
 import datetime
 
 # Import encoding now, to avoid implicit import later.
@@ -173,10 +177,10 @@ class RequestHooksMixin(object):
         if event not in self.hooks:
             raise ValueError('Unsupported event specified, with event name "%s"' % (event))
 
-        if isinstance(hook, collections.Callable):
+        if isinstance(hook, _collections_abc.Callable):
             self.hooks[event].append(hook)
         elif hasattr(hook, '__iter__'):
-            self.hooks[event].extend(h for h in hook if isinstance(h, collections.Callable))
+            self.hooks[event].extend(h for h in hook if isinstance(h, _collections_abc.Callable))
 
     def deregister_hook(self, event, hook):
         """Deregister a previously registered hook.
@@ -448,7 +452,7 @@ class PreparedRequest(RequestEncodingMixin, RequestHooksMixin):
 
         is_stream = all([
             hasattr(data, '__iter__'),
-            not isinstance(data, (basestring, list, tuple, collections.Mapping))
+            not isinstance(data, (basestring, list, tuple, _collections_abc.Mapping))
         ])
 
         try:
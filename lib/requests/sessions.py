@@ -8,7 +8,10 @@ This module provides a Session object to manage and persist settings across
 requests (cookies, auth, proxies).
 """
 import os
-from collections import Mapping
+try:
+    from collections.abc import Mapping
+except ImportError:  # python2
+    from collections import Mapping
 from datetime import datetime
 
 from .auth import _basic_auth_str
@@ -8,15 +8,19 @@ Data structures that power Requests.
 """
 
 import collections
+try:
+    import collections.abc as _collections_abc
+except ImportError:  # python2
+    import collections as _collections_abc
 
 from .compat import OrderedDict
 
 
-class CaseInsensitiveDict(collections.MutableMapping):
+class CaseInsensitiveDict(_collections_abc.MutableMapping):
     """A case-insensitive ``dict``-like object.
 
     Implements all methods and operations of
-    ``collections.MutableMapping`` as well as dict's ``copy``. Also
+    ``_collections_abc.MutableMapping`` as well as dict's ``copy``. Also
     provides ``lower_items``.
 
     All keys are expected to be strings. The structure remembers the
@@ -71,7 +75,7 @@ class CaseInsensitiveDict(collections.MutableMapping):
         )
 
     def __eq__(self, other):
-        if isinstance(other, collections.Mapping):
+        if isinstance(other, _collections_abc.Mapping):
             other = CaseInsensitiveDict(other)
         else:
             return NotImplemented
@@ -11,6 +11,10 @@ that are also useful for external consumption.
 import cgi
 import codecs
 import collections
+try:
+    import collections.abc as _collections_abc
+except ImportError:  # python2
+    import collections as _collections_abc
 import io
 import os
 import re
@@ -211,7 +215,7 @@ def to_key_val_list(value):
     if isinstance(value, (str, bytes, bool, int)):
         raise ValueError('cannot encode objects that are not 2-tuples')
 
-    if isinstance(value, collections.Mapping):
+    if isinstance(value, _collections_abc.Mapping):
         value = value.items()
 
     return list(value)